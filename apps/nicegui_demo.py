@@ -14,6 +14,7 @@ import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -22,7 +23,7 @@ import sys
 from typing import Any, Callable, Iterable, Sequence
 from uuid import UUID
 
-from nicegui import events, ui
+from nicegui import events, run, ui
 from dotenv import load_dotenv
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -78,6 +79,7 @@ SAMPLE_DATASET = SAMPLE_DATA_DIR / "sample_dataset.csv"
 SAMPLE_DATASET_SOURCE = (
     Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "datasets" / "sample_dataset.csv"
 )
+RENDER_CACHE_SIZE = 256
 
 
 # ---------------------------------------------------------------------------
@@ -233,6 +235,7 @@ class AppState:
     selected_document_id: str | None = None
     selected_block_id: str | None = None
     block_cache: dict[str, Block] = field(default_factory=dict)
+    render_cache: OrderedDict[tuple[str, int, bool, bool], str] = field(default_factory=OrderedDict)
     filter_results: list[Block] = field(default_factory=list)
     filter_summary: str = ""
 
@@ -487,10 +490,24 @@ def _render_block(state: AppState, block: Block) -> None:
         include_metadata=include_metadata,
         recursive=recursive,
     )
-    rendered = state.renderer.render(block, options=options)
+    rendered = _render_cached(state, block, options)
     state.markdown_view.set_content(rendered or "_(empty block)_")
 
 
+def _render_cached(state: AppState, block: Block, options: RenderOptions) -> str:
+    """Render ``block`` once per (id, version, options); the cache resets on document reloads."""
+    key = (str(block.id), block.version, options.include_metadata, options.recursive)
+    cached = state.render_cache.get(key)
+    if cached is not None:
+        state.render_cache.move_to_end(key)
+        return cached
+    rendered = state.renderer.render(block, options=options)
+    state.render_cache[key] = rendered
+    if len(state.render_cache) > RENDER_CACHE_SIZE:
+        state.render_cache.popitem(last=False)
+    return rendered
+
+
 def _render_document_markdown(state: AppState, document_block: Block | None = None) -> None:
     if state.document_markdown_view is None:
         return
@@ -513,7 +530,7 @@ def _render_document_markdown(state: AppState, document_block: Block | None = No
         state.document_markdown_view.set_content("_(document unavailable)_")
         return
 
-    rendered = state.renderer.render(document_block, options=options)
+    rendered = _render_cached(state, document_block, options)
     state.document_markdown_view.set_content(rendered or "_(empty document)_")
 
 
@@ -636,6 +653,8 @@ def _load_document(state: AppState, document_id: str | None) -> None:
     state.selected_document_id = doc_value
     state.selected_block_id = None
     state.block_cache = {}
+    # Rendered output depends on descendants, so any reload drops every entry.
+    state.render_cache.clear()
 
     if not doc_value or state.tree_component is None:
         _set_tree_nodes(state.tree_component, [])
@@ -997,13 +1016,15 @@ def _build_upload_section(state: AppState) -> None:
             "Upload sample content to see it immediately in the canonical tree."
         ).classes("text-sm text-slate-600 pb-2 w-full")
 
+        # Parsing runs on NiceGUI's worker threads so large uploads do not stall the
+        # event loop; persistence and UI refresh stay on the loop.
         async def handle_markdown(event: events.UploadEventArguments) -> None:
             try:
                 content = await event.file.text()
             except Exception as exc:
                 ui.notify(f"Upload failed: {exc}", color="negative")
                 return
-            blocks = markdown_to_blocks(content)
+            blocks = await run.io_bound(markdown_to_blocks, content)
             blocks = _attach_source_metadata(blocks, event.file.name)
             state.store.upsert_blocks(blocks)
             ui.notify("Stored Markdown document", color="positive")
@@ -1012,7 +1033,7 @@ def _build_upload_section(state: AppState) -> None:
         async def handle_pdf(event: events.UploadEventArguments) -> None:
             try:
                 data = await event.file.read()
-                blocks = azure_di_to_blocks(io.BytesIO(data))
+                blocks = await run.io_bound(azure_di_to_blocks, io.BytesIO(data))
             except Exception as exc:
                 ui.notify(f"Azure DI parse failed: {exc}", color="negative")
                 return
@@ -1024,7 +1045,7 @@ def _build_upload_section(state: AppState) -> None:
         async def handle_dataset(event: events.UploadEventArguments) -> None:
             try:
                 data = await event.file.read()
-                blocks = dataset_to_blocks(io.BytesIO(data))
+                blocks = await run.io_bound(dataset_to_blocks, io.BytesIO(data))
             except Exception as exc:
                 ui.notify(f"Dataset parse failed: {exc}", color="negative")
                 return
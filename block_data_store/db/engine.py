@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import math
 from pathlib import Path
 from typing import Any, Mapping
 
 from sqlalchemy import create_engine as sa_create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+try:  # Optional: faster encoding/decoding of the JSON columns.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
 DEFAULT_SQLITE_URL = "sqlite+pysqlite:///:memory:"
 
@@ -38,6 +46,11 @@ def create_engine(
       in-memory SQLite URL is used (the previous default behaviour).
     - ``sqlite_path`` accepts strings or ``pathlib.Path`` instances and expands
       user/home references.
+    - In-memory SQLite engines use a single shared connection (``StaticPool``) so
+      the schema and data are visible from every thread and session.
+    - JSON columns are encoded with ``orjson`` when it is installed; values it
+      cannot represent faithfully (ints wider than 64 bits, NaN/Infinity) and
+      installs without it use the stdlib ``json`` module.
     """
     if connection_string and sqlite_path is not None:
         raise ValueError("Provide either 'connection_string' or 'sqlite_path', not both.")
@@ -50,7 +63,58 @@ def create_engine(
     else:
         url = DEFAULT_SQLITE_URL
 
-    return sa_create_engine(url, echo=echo, future=True, connect_args=connect_args or {})
+    engine_options: dict[str, Any] = {}
+    connect_options = dict(connect_args or {})
+    if orjson is not None:
+        engine_options.update(json_serializer=_orjson_dumps, json_deserializer=_orjson_loads)
+    if _is_sqlite_memory(url):
+        engine_options["poolclass"] = StaticPool
+        connect_options.setdefault("check_same_thread", False)
+
+    return sa_create_engine(
+        url,
+        echo=echo,
+        future=True,
+        connect_args=connect_options,
+        **engine_options,
+    )
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+
+
+def _orjson_dumps(value: Any) -> str:
+    try:
+        encoded = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:  # e.g. ints wider than 64 bits
+        return json.dumps(value)
+    # orjson writes NaN/Infinity as null; keep stdlib's encoding for those values.
+    if b"null" in encoded and _has_non_finite_float(value):
+        return json.dumps(value)
+    return encoded.decode()
+
+
+def _orjson_loads(value: str | bytes) -> Any:
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:  # rows written by stdlib json may hold NaN/Infinity
+        return json.loads(value)
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -5,13 +5,23 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, delete, func, insert, inspect, select
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql.sqltypes import JSON
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+# Bump whenever tables or indexes change so existing databases are re-checked.
+# Version 2: ``children_ids`` became a native array (with a GIN index) on Postgres.
+# create_all only adds missing tables/indexes; see docs/GETTING_STARTED.md for
+# migrating the column of databases created before that.
+SCHEMA_VERSION = 2
 
 JSON_TYPE = JSON().with_variant(JSONB, "postgresql")
+# Child ids stay strings on every dialect; Postgres stores them as a native array
+# so containment checks can use a GIN index instead of decoding JSON per row.
+CHILDREN_IDS_TYPE = JSON().with_variant(ARRAY(String(36)), "postgresql")
 
 
 class Base(DeclarativeBase):
@@ -34,13 +44,18 @@ class DbBlock(Base):
             "properties",
             postgresql_using="gin",
         ),
+        Index(
+            "ix_blocks_children_gin",
+            "children_ids",
+            postgresql_using="gin",
+        ),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     type: Mapped[str] = mapped_column(String(32), nullable=False)
     parent_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     root_id: Mapped[str] = mapped_column(String(36), nullable=False)
-    children_ids: Mapped[list[str]] = mapped_column(JSON_TYPE, default=list, nullable=False)
+    children_ids: Mapped[list[str]] = mapped_column(CHILDREN_IDS_TYPE, default=list, nullable=False)
     workspace_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     in_trash: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -54,7 +69,9 @@ class DbBlock(Base):
     last_edited_by: Mapped[str | None] = mapped_column(String(36), nullable=True)
     properties: Mapped[dict[str, Any]] = mapped_column(JSON_TYPE, default=dict, nullable=False)
     metadata_json: Mapped[dict[str, Any]] = mapped_column("metadata", JSON_TYPE, default=dict, nullable=False)
-    content: Mapped[Any] = mapped_column(JSON_TYPE, nullable=True)
+    # Potentially large payload; deferred so structural reads (hierarchy edits, trash
+    # cascades) do not load it. Hydrating queries opt back in with ``undefer``.
+    content: Mapped[Any] = mapped_column(JSON_TYPE, nullable=True, deferred=True)
     properties_version: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
 
@@ -91,9 +108,42 @@ class DbRelationship(Base):
     last_edited_by: Mapped[str | None] = mapped_column(String(36), nullable=True)
 
 
+class DbSchemaVersion(Base):
+    """Single-row marker recording the schema version a database was created with."""
+
+    __tablename__ = "schema_version"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
 def create_all(engine: Engine) -> None:
-    """Create database tables for the schema."""
+    """Create database tables for the schema.
+
+    Databases already stamped with ``SCHEMA_VERSION`` whose tables are all present are
+    left untouched, which skips the per-index existence probes on every start-up.
+    """
+    if _stored_schema_version(engine) == SCHEMA_VERSION and _tables_present(engine):
+        return
+
     Base.metadata.create_all(engine, checkfirst=True)
+    with engine.begin() as connection:
+        connection.execute(delete(DbSchemaVersion))
+        connection.execute(insert(DbSchemaVersion).values(version=SCHEMA_VERSION))
+
+
+def _tables_present(engine: Engine) -> bool:
+    # A stamp alone is not enough: callers may drop individual tables to reset data.
+    existing = set(inspect(engine).get_table_names())
+    return existing.issuperset(Base.metadata.tables)
+
+
+def _stored_schema_version(engine: Engine) -> int | None:
+    try:
+        with engine.connect() as connection:
+            return connection.execute(select(DbSchemaVersion.version)).scalar()
+    except DBAPIError:
+        # The marker table does not exist yet.
+        return None
 
 
-__all__ = ["Base", "DbBlock", "DbRelationship", "create_all"]
+__all__ = ["Base", "DbBlock", "DbRelationship", "DbSchemaVersion", "SCHEMA_VERSION", "create_all"]
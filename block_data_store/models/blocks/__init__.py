@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from typing import Annotated, Union
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
-from .base import Block, BlockProperties, BlockType, Content
+from .base import Block, BlockProperties, BlockType, Content, GroupedProperties
 from .code import CodeBlock, CodeProps
 from .collection import CollectionBlock, CollectionProps
 from .chunk_group import ChunkGroupBlock, ChunkGroupProps
@@ -103,14 +103,35 @@ PROPERTIES_CLASS_MAP = {
 }
 
 
+# Enum construction is comparatively slow; rows loaded from the database carry the
+# raw string value, so resolve members through a plain dict (str-enum members hash
+# like their values, so the same lookup serves both spellings).
+_BLOCK_TYPE_BY_VALUE: dict[str, BlockType] = {member.value: member for member in BlockType}
+
+
+def block_type_for(block_type: BlockType | str) -> BlockType:
+    """Return the ``BlockType`` member for a member or its string value."""
+    normalized = _BLOCK_TYPE_BY_VALUE.get(block_type)
+    if normalized is None:
+        # Defer to the enum so unknown values raise the usual ValueError.
+        normalized = BlockType(block_type)
+    return normalized
+
+
+_BLOCK_LIST_ADAPTER: TypeAdapter[list[Block]] = TypeAdapter(list[AnyBlock])
+
+
+def blocks_from_json_bytes(data: bytes | str) -> list[Block]:
+    """Parse a JSON array of blocks in one pass, dispatching each item on its ``type``."""
+    return _BLOCK_LIST_ADAPTER.validate_json(data)
+
+
 def block_class_for(block_type: BlockType | str) -> type[Block]:
-    normalized = BlockType(block_type) if not isinstance(block_type, BlockType) else block_type
-    return BLOCK_CLASS_MAP.get(normalized, Block)
+    return BLOCK_CLASS_MAP.get(block_type_for(block_type), Block)
 
 
 def properties_model_for(block_type: BlockType | str) -> type[BlockProperties]:
-    normalized = BlockType(block_type) if not isinstance(block_type, BlockType) else block_type
-    return PROPERTIES_CLASS_MAP.get(normalized, BlockProperties)
+    return PROPERTIES_CLASS_MAP.get(block_type_for(block_type), BlockProperties)
 
 
 __all__ = [
@@ -119,6 +140,7 @@ __all__ = [
     "BlockProperties",
     "BlockType",
     "Content",
+    "GroupedProperties",
     "WorkspaceBlock",
     "WorkspaceProps",
     "CollectionBlock",
@@ -159,5 +181,7 @@ __all__ = [
     "UnsupportedBlock",
     "UnsupportedProps",
     "block_class_for",
+    "blocks_from_json_bytes",
+    "block_type_for",
     "properties_model_for",
 ]
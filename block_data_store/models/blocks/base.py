@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -48,10 +48,24 @@ class BlockProperties(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class GroupedProperties(BlockProperties):
+    """Properties for content blocks that can belong to page or chunk groups."""
+
+    groups: list[UUID] = Field(default_factory=list)
+
+
 ResolveOne = Callable[[UUID | None], "Block | None"]
 ResolveMany = Callable[[Sequence[UUID]], list["Block"]]
 
 
+def _resolve_no_block(_block_id: UUID | None) -> None:
+    return None
+
+
+def _resolve_no_blocks(_block_ids: Sequence[UUID]) -> list[Block]:
+    return []
+
+
 class Block(BaseModel):
     """Immutable representation of a block node."""
 
@@ -72,31 +86,64 @@ class Block(BaseModel):
     content: Content | None = None
     properties_version: int | None = None
 
-    _resolve_one: ResolveOne = PrivateAttr(default=lambda _id: None)
-    _resolve_many: ResolveMany = PrivateAttr(default=lambda ids: [])
+    # Module-level defaults (not lambdas) keep unwired blocks picklable.
+    _resolve_one: ResolveOne = PrivateAttr(default=_resolve_no_block)
+    _resolve_many: ResolveMany = PrivateAttr(default=_resolve_no_blocks)
 
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
     def parent(self) -> Block | None:
         return self._resolve_one(self.parent_id) if self.parent_id else None
 
-    def children(self) -> list[Block]:
+    def children(self) -> Sequence[Block]:
         if not self.children_ids:
-            return []
+            # The empty tuple is a shared singleton, so leaves allocate nothing.
+            return ()
         return self._resolve_many(self.children_ids)
 
+    def descendants_bfs(self, max_depth: int | None = None) -> Iterator[Block]:
+        """Yield descendants level by level, resolving each level with one batched call."""
+        level: Sequence[Block] = (self,)
+        depth = 0
+        while max_depth is None or depth < max_depth:
+            child_ids = [child_id for block in level for child_id in block.children_ids]
+            if not child_ids:
+                return
+            level = self._resolve_many(child_ids)
+            yield from level
+            depth += 1
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes | str) -> Block:
+        """Validate a block directly from JSON, without an intermediate ``json.loads`` dict."""
+        return cls.model_validate_json(data)
+
     def with_resolvers(
         self,
         *,
         resolve_one: ResolveOne | None = None,
         resolve_many: ResolveMany | None = None,
+        copy: bool = True,
     ) -> Block:
-        clone = self.model_copy()
+        """Return a block whose ``parent()``/``children()`` use the given resolvers.
+
+        ``copy=False`` binds in place and skips the clone; only use it for blocks the
+        caller has just built and not yet shared.
+        """
+        target = self.model_copy() if copy else self
         if resolve_one is not None:
-            object.__setattr__(clone, "_resolve_one", resolve_one)
+            object.__setattr__(target, "_resolve_one", resolve_one)
         if resolve_many is not None:
-            object.__setattr__(clone, "_resolve_many", resolve_many)
-        return clone
-
-
-__all__ = ["Block", "BlockProperties", "BlockType", "Content", "ResolveOne", "ResolveMany"]
+            object.__setattr__(target, "_resolve_many", resolve_many)
+        return target
+
+
+__all__ = [
+    "Block",
+    "BlockProperties",
+    "BlockType",
+    "Content",
+    "GroupedProperties",
+    "ResolveOne",
+    "ResolveMany",
+]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class ChunkGroupProps(BlockProperties):
 
 
 class ChunkGroupBlock(Block):
-    type: BlockType = Field(default=BlockType.CHUNK_GROUP, frozen=True)
+    type: Literal[BlockType.CHUNK_GROUP] = Field(default=BlockType.CHUNK_GROUP, frozen=True)
     properties: ChunkGroupProps
 
 
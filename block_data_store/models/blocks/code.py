@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class CodeProps(BlockProperties):
+class CodeProps(GroupedProperties):
     language: str | None = None
-    groups: list[UUID] = Field(default_factory=list)
 
 
 class CodeBlock(Block):
-    type: BlockType = Field(default=BlockType.CODE, frozen=True)
+    type: Literal[BlockType.CODE] = Field(default=BlockType.CODE, frozen=True)
     properties: CodeProps = Field(default_factory=CodeProps)
 
 
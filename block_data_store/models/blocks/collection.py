@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class CollectionProps(BlockProperties):
 
 
 class CollectionBlock(Block):
-    type: BlockType = Field(default=BlockType.COLLECTION, frozen=True)
+    type: Literal[BlockType.COLLECTION] = Field(default=BlockType.COLLECTION, frozen=True)
     properties: CollectionProps
 
 
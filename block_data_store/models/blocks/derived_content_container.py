@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class DerivedContentContainerProps(BlockProperties):
 
 
 class DerivedContentContainerBlock(Block):
-    type: BlockType = Field(default=BlockType.DERIVED_CONTENT_CONTAINER, frozen=True)
+    type: Literal[BlockType.DERIVED_CONTENT_CONTAINER] = Field(default=BlockType.DERIVED_CONTENT_CONTAINER, frozen=True)
     properties: DerivedContentContainerProps
 
 
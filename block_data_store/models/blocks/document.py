@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -13,7 +15,7 @@ class DocumentProps(BlockProperties):
 
 
 class DocumentBlock(Block):
-    type: BlockType = Field(default=BlockType.DOCUMENT, frozen=True)
+    type: Literal[BlockType.DOCUMENT] = Field(default=BlockType.DOCUMENT, frozen=True)
     properties: DocumentProps
 
 
@@ -14,7 +14,7 @@ class GroupIndexProps(BlockProperties):
 
 
 class GroupIndexBlock(Block):
-    type: BlockType = Field(default=BlockType.GROUP_INDEX, frozen=True)
+    type: Literal[BlockType.GROUP_INDEX] = Field(default=BlockType.GROUP_INDEX, frozen=True)
     properties: GroupIndexProps
 
 
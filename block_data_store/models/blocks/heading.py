@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class HeadingProps(BlockProperties):
+class HeadingProps(GroupedProperties):
     level: int = Field(default=2, ge=1, le=6)
-    groups: list[UUID] = Field(default_factory=list)
 
 
 class HeadingBlock(Block):
-    type: BlockType = Field(default=BlockType.HEADING, frozen=True)
+    type: Literal[BlockType.HEADING] = Field(default=BlockType.HEADING, frozen=True)
     properties: HeadingProps = Field(default_factory=HeadingProps)
 
 
@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class HtmlProps(BlockProperties):
-    groups: list[UUID] = Field(default_factory=list)
+class HtmlProps(GroupedProperties):
+    pass
 
 
 class HtmlBlock(Block):
-    type: BlockType = Field(default=BlockType.HTML, frozen=True)
+    type: Literal[BlockType.HTML] = Field(default=BlockType.HTML, frozen=True)
     properties: HtmlProps = Field(default_factory=HtmlProps)
 
 
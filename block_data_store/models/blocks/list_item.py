@@ -2,24 +2,24 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class ListItemProps(BlockProperties):
-    groups: list[UUID] = Field(default_factory=list)
+class ListItemProps(GroupedProperties):
+    pass
 
 
 class BulletedListItemBlock(Block):
-    type: BlockType = Field(default=BlockType.BULLETED_LIST_ITEM, frozen=True)
+    type: Literal[BlockType.BULLETED_LIST_ITEM] = Field(default=BlockType.BULLETED_LIST_ITEM, frozen=True)
     properties: ListItemProps = Field(default_factory=ListItemProps)
 
 
 class NumberedListItemBlock(Block):
-    type: BlockType = Field(default=BlockType.NUMBERED_LIST_ITEM, frozen=True)
+    type: Literal[BlockType.NUMBERED_LIST_ITEM] = Field(default=BlockType.NUMBERED_LIST_ITEM, frozen=True)
     properties: ListItemProps = Field(default_factory=ListItemProps)
 
 
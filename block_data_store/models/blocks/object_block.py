@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class ObjectProps(BlockProperties):
+class ObjectProps(GroupedProperties):
     category: str | None = None
-    groups: list[UUID] = Field(default_factory=list)
 
 
 class ObjectBlock(Block):
-    type: BlockType = Field(default=BlockType.OBJECT, frozen=True)
+    type: Literal[BlockType.OBJECT] = Field(default=BlockType.OBJECT, frozen=True)
     properties: ObjectProps = Field(default_factory=ObjectProps)
 
 
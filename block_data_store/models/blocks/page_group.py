@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class PageGroupProps(BlockProperties):
 
 
 class PageGroupBlock(Block):
-    type: BlockType = Field(default=BlockType.PAGE_GROUP, frozen=True)
+    type: Literal[BlockType.PAGE_GROUP] = Field(default=BlockType.PAGE_GROUP, frozen=True)
     properties: PageGroupProps
 
 
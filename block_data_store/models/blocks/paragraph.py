@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class ParagraphProps(BlockProperties):
-    groups: list[UUID] = Field(default_factory=list)
+class ParagraphProps(GroupedProperties):
+    pass
 
 
 class ParagraphBlock(Block):
-    type: BlockType = Field(default=BlockType.PARAGRAPH, frozen=True)
+    type: Literal[BlockType.PARAGRAPH] = Field(default=BlockType.PARAGRAPH, frozen=True)
     properties: ParagraphProps
 
 
@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class QuoteProps(BlockProperties):
-    groups: list[UUID] = Field(default_factory=list)
+class QuoteProps(GroupedProperties):
+    pass
 
 
 class QuoteBlock(Block):
-    type: BlockType = Field(default=BlockType.QUOTE, frozen=True)
+    type: Literal[BlockType.QUOTE] = Field(default=BlockType.QUOTE, frozen=True)
     properties: QuoteProps = Field(default_factory=QuoteProps)
 
 
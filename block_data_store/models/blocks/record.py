@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class RecordProps(BlockProperties):
-    groups: list[UUID] = Field(default_factory=list)
+class RecordProps(GroupedProperties):
+    pass
 
 
 class RecordBlock(Block):
-    type: BlockType = Field(default=BlockType.RECORD, frozen=True)
+    type: Literal[BlockType.RECORD] = Field(default=BlockType.RECORD, frozen=True)
     properties: RecordProps
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class SystemContainerProps(BlockProperties):
 
 
 class SystemContainerBlock(Block):
-    type: BlockType = Field(default=BlockType.SYSTEM_CONTAINER, frozen=True)
+    type: Literal[BlockType.SYSTEM_CONTAINER] = Field(default=BlockType.SYSTEM_CONTAINER, frozen=True)
     properties: SystemContainerProps
 
 
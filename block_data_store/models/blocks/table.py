@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from uuid import UUID
+from typing import Literal
 
 from pydantic import Field
 
-from .base import Block, BlockProperties, BlockType
+from .base import Block, BlockType, GroupedProperties
 
 
-class TableProps(BlockProperties):
-    groups: list[UUID] = Field(default_factory=list)
+class TableProps(GroupedProperties):
+    pass
 
 
 class TableBlock(Block):
-    type: BlockType = Field(default=BlockType.TABLE, frozen=True)
+    type: Literal[BlockType.TABLE] = Field(default=BlockType.TABLE, frozen=True)
     properties: TableProps = Field(default_factory=TableProps)
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class UnsupportedProps(BlockProperties):
 
 
 class UnsupportedBlock(Block):
-    type: BlockType = Field(default=BlockType.UNSUPPORTED, frozen=True)
+    type: Literal[BlockType.UNSUPPORTED] = Field(default=BlockType.UNSUPPORTED, frozen=True)
     properties: UnsupportedProps = Field(default_factory=UnsupportedProps)
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 
 from .base import Block, BlockProperties, BlockType
@@ -12,7 +14,7 @@ class WorkspaceProps(BlockProperties):
 
 
 class WorkspaceBlock(Block):
-    type: BlockType = Field(default=BlockType.WORKSPACE, frozen=True)
+    type: Literal[BlockType.WORKSPACE] = Field(default=BlockType.WORKSPACE, frozen=True)
     properties: WorkspaceProps
 
 
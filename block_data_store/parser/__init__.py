@@ -6,6 +6,7 @@ from .markdown_parser import (
     MarkdownAst,
     ast_to_blocks,
     load_markdown_path,
+    load_markdown_paths,
     markdown_to_blocks,
     parse_markdown,
 )
@@ -20,5 +21,6 @@ __all__ = [
     "parse_markdown",
     "markdown_to_blocks",
     "load_markdown_path",
+    "load_markdown_paths",
     "ast_to_blocks",
 ]
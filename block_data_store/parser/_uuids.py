@@ -0,0 +1,34 @@
+"""Batched random UUID generation shared by the parsers."""
+
+from __future__ import annotations
+
+import os
+from uuid import UUID
+
+
+def bulk_uuid4(count: int) -> list[UUID]:
+    """Generate ``count`` random (version 4) UUIDs from a single ``urandom`` call."""
+    raw = os.urandom(16 * count)
+    return [UUID(bytes=raw[offset : offset + 16], version=4) for offset in range(0, 16 * count, 16)]
+
+
+class UUIDBatch:
+    """Hands out random (version 4) UUIDs, drawing ``urandom`` once per batch."""
+
+    __slots__ = ("_size", "_raw", "_offset")
+
+    def __init__(self, size: int = 256) -> None:
+        self._size = size
+        self._raw = b""
+        self._offset = 0
+
+    def next(self) -> UUID:
+        offset = self._offset
+        if offset >= len(self._raw):
+            self._raw = os.urandom(16 * self._size)
+            offset = 0
+        self._offset = offset + 16
+        return UUID(bytes=self._raw[offset : offset + 16], version=4)
+
+
+__all__ = ["UUIDBatch", "bulk_uuid4"]
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
+import atexit
 import hashlib
-import io
 import json
+import mmap
 import os
 import re
+import threading
 from pathlib import Path
-from typing import IO, Any, Literal, Sequence
+from typing import IO, Any, Callable, Iterable, Iterator, Literal, Sequence
 from uuid import UUID, uuid4
 
 from block_data_store.models.block import Block, BlockType
@@ -21,8 +27,25 @@ from block_data_store.models.blocks import (
     PageGroupProps,
 )
 
+from ._uuids import bulk_uuid4
 from .markdown_parser import markdown_to_blocks
 
+try:  # Optional: faster cache (de)serialisation.
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+MEMORY_CACHE_SIZE = 32
+_MEMORY_CACHE: OrderedDict[Path, dict[str, Any]] = OrderedDict()
+_MEMORY_CACHE_LOCK = threading.Lock()
+_READ_CHUNK_SIZE = 1 << 20
+_PARALLEL_PAGE_THRESHOLD = 8  # below this, dispatching to workers outweighs the parse
+_PAGE_POOLS: dict[int, ProcessPoolExecutor] = {}
+_PAGE_POOLS_LOCK = threading.Lock()
+_MARKER_HTML_RE = re.compile(
+    r"^\s*<!--\s*(PageBreak|PageNumber\s*=\s*\".*?\"|PageFooter\s*=\s*\".*?\")\s*-->\s*$"
+)
+
 
 @dataclass(slots=True)
 class AzureDiConfig:
@@ -47,18 +70,29 @@ def analyze_with_cache(
     config: AzureDiConfig | None = None,
     client: Any = None,
 ) -> dict[str, Any]:
-    """Return a cached-or-fresh AnalyzeResult payload with only the needed fields."""
+    """Return a cached-or-fresh AnalyzeResult payload with only the needed fields.
+
+    Recently used payloads are also kept in memory, so repeated calls for the
+    same source skip the disk read; treat the returned dict as read-only.
+    """
 
     cfg = config or AzureDiConfig()
-    data, tag = _read_source_bytes(source)
-    cache_key = _cache_key(data, cfg.model_id, cfg.content_format, tag)
+    chunks, load_data, tag = _open_source(source)
+    cache_key = _cache_key(chunks, cfg.model_id, cfg.content_format, tag)
     cache_path = cfg.cache_dir / f"{cache_key}.json"
+    payload = _memory_cache_get(cache_path)
+    if payload is not None:
+        return payload
     if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
-
-    payload = _run_analyze_request(data, cfg, client)
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(json.dumps(payload), encoding="utf-8")
+        payload = _loads(cache_path.read_bytes())
+    else:
+        raw = _dumps(_run_analyze_request(load_data(), cfg, client))
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(raw)
+        # Read back the serialised form so fresh and cached payloads share types
+        # (``fetched_at`` is an ISO string either way).
+        payload = _loads(raw)
+    _memory_cache_put(cache_path, payload)
     return payload
 
 
@@ -73,8 +107,14 @@ def azure_di_to_blocks(
     config: AzureDiConfig | None = None,
     client: Any = None,
     strip_marker_html: bool = True,
+    max_workers: int | None = None,
 ) -> list[Block]:
-    """Parse source bytes via Azure DI and convert to Decipher blocks."""
+    """Parse source bytes via Azure DI and convert to Decipher blocks.
+
+    Pages are parsed in-process by default. Pass ``max_workers`` greater than one
+    to parse long documents on a shared process pool of that size, which is
+    created on first use and reused by later calls.
+    """
 
     cfg = config or AzureDiConfig()
     payload = analyze_with_cache(source, config=cfg, client=client)
@@ -99,6 +139,7 @@ def azure_di_to_blocks(
             workspace_id=workspace_id,
             document_id=doc_id,
             timestamp=ts,
+            max_workers=max_workers,
         )
     else:
         blocks = markdown_to_blocks(
@@ -114,6 +155,7 @@ def azure_di_to_blocks(
                 page_groups=page_groups,
                 workspace_id=workspace_id,
                 timestamp=ts,
+                max_workers=max_workers,
             )
 
     if page_groups:
@@ -128,42 +170,99 @@ def azure_di_to_blocks(
 # ---- helpers -----------------------------------------------------------------
 
 
-def _read_source_bytes(source: str | Path | bytes | IO[bytes]) -> tuple[bytes, str | None]:
+def _open_source(
+    source: str | Path | bytes | IO[bytes],
+) -> tuple[Iterable[bytes | mmap.mmap], Callable[[], bytes], str | None]:
+    """Return chunks to hash, a loader for the full bytes, and the cache tag.
+
+    Path sources are hashed through a read-only memory map and only loaded in
+    full on a cache miss; streams can only be read once, so their chunks are buffered.
+    """
     if isinstance(source, (bytes, bytearray)):
-        return bytes(source), None
+        data = bytes(source)
+        return (data,), lambda: data, None
 
     if isinstance(source, (str, Path)):
         path = Path(source)
-        data = path.read_bytes()
-        return data, str(path.resolve())
-
-    if isinstance(source, io.BufferedReader):
-        return source.read(), None
+        return _iter_file_chunks(path), path.read_bytes, str(path.resolve())
 
     if hasattr(source, "read"):
-        data = source.read()
-        if not isinstance(data, (bytes, bytearray)):
-            raise TypeError("Expected bytes from stream")
-        return bytes(data), None
+        buffer = bytearray()
+        return _iter_stream_chunks(source, buffer), lambda: bytes(buffer), None
 
     raise TypeError("Unsupported source type for Azure DI parser")
 
 
+def _iter_file_chunks(path: Path) -> Iterator[bytes | mmap.mmap]:
+    with path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # empty files and pipes cannot be mapped
+            mapped = None
+        if mapped is not None:
+            with mapped:
+                yield mapped
+            return
+        while chunk := handle.read(_READ_CHUNK_SIZE):
+            yield chunk
+
+
+def _iter_stream_chunks(stream: IO[bytes], buffer: bytearray) -> Iterator[bytes]:
+    while chunk := stream.read(_READ_CHUNK_SIZE):
+        if not isinstance(chunk, (bytes, bytearray)):
+            raise TypeError("Expected bytes from stream")
+        buffer.extend(chunk)
+        yield chunk
+
+
 def _cache_key(
-    data: bytes,
+    chunks: Iterable[bytes | mmap.mmap],
     model_id: str,
     content_format: str,
     tag: str | None,
 ) -> str:
-    h = hashlib.sha256()
-    h.update(data)
-    h.update(model_id.encode("utf-8"))
-    h.update(content_format.encode("utf-8"))
-    if tag:
-        h.update(tag.encode("utf-8"))
+    h = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        h.update(chunk)
+    h.update(f"\x1f{model_id}\x1f{content_format}\x1f{tag or ''}".encode("utf-8"))
     return h.hexdigest()
 
 
+def _memory_cache_get(cache_path: Path) -> dict[str, Any] | None:
+    with _MEMORY_CACHE_LOCK:
+        payload = _MEMORY_CACHE.get(cache_path)
+        if payload is not None:
+            _MEMORY_CACHE.move_to_end(cache_path)
+        return payload
+
+
+def _memory_cache_put(cache_path: Path, payload: dict[str, Any]) -> None:
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[cache_path] = payload
+        _MEMORY_CACHE.move_to_end(cache_path)
+        while len(_MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
+
+def _loads(raw: bytes) -> dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(payload: dict[str, Any]) -> bytes:
+    """Serialise a payload; datetimes are written as ISO 8601 strings."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_isoformat).encode("utf-8")
+
+
+def _isoformat(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def _run_analyze_request(
     data: bytes,
     config: AzureDiConfig,
@@ -198,28 +297,23 @@ def _run_analyze_request(
 def _result_payload(result: Any) -> dict[str, Any]:
     pages_payload: list[dict[str, Any]] = []
     for page in getattr(result, "pages", []) or []:
-        spans_payload: list[dict[str, int]] = []
-        for span in getattr(page, "spans", []) or []:
-            offset = _get_attr(span, "offset", 0)
-            length = _get_attr(span, "length", 0)
-            spans_payload.append({"offset": int(offset), "length": int(length)})
+        spans = getattr(page, "spans", []) or []
+        # SDK results carry either plain dicts or model objects; pick the accessor once per page.
+        get = dict.get if spans and isinstance(spans[0], dict) else getattr
+        spans_payload = [
+            {"offset": int(get(span, "offset", 0)), "length": int(get(span, "length", 0))} for span in spans
+        ]
         pages_payload.append({"spans": spans_payload})
 
     payload = {
         "content": getattr(result, "content", "") or "",
         "pages": pages_payload,
         "model_id": getattr(result, "model_id", None),
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": datetime.now(timezone.utc),
     }
     return payload
 
 
-def _get_attr(obj: Any, key: str, default: Any) -> Any:
-    if isinstance(obj, dict):
-        return obj.get(key, default)
-    return getattr(obj, key, default)
-
-
 def _page_texts(payload: dict[str, Any]) -> list[str]:
     content: str = payload.get("content", "") or ""
     texts: list[str] = []
@@ -227,9 +321,9 @@ def _page_texts(payload: dict[str, Any]) -> list[str]:
         spans = page.get("spans") or []
         if not spans:
             continue
-        span = spans[0]
-        offset = max(0, int(_get_attr(span, "offset", 0)))
-        length = max(0, int(_get_attr(span, "length", 0)))
+        span = spans[0]  # cached payloads always hold plain dict spans
+        offset = max(0, int(span.get("offset", 0)))
+        length = max(0, int(span.get("length", 0)))
         if length <= 0:
             continue
         texts.append(content[offset : offset + length])
@@ -239,7 +333,7 @@ def _page_texts(payload: dict[str, Any]) -> list[str]:
 def _page_group_ids(page_count: int, create_groups: bool) -> dict[int, UUID]:
     if not create_groups or page_count <= 0:
         return {}
-    return {number: uuid4() for number in range(1, page_count + 1)}
+    return dict(zip(range(1, page_count + 1), bulk_uuid4(page_count)))
 
 
 def _page_first_blocks(
@@ -249,6 +343,7 @@ def _page_first_blocks(
     workspace_id: UUID | None,
     document_id: UUID,
     timestamp: datetime,
+    max_workers: int | None = None,
 ) -> list[Block]:
     if not page_texts:
         return markdown_to_blocks(
@@ -262,22 +357,21 @@ def _page_first_blocks(
     children: list[UUID] = []
     collected: list[Block] = []
 
-    for index, page_text in enumerate(page_texts, start=1):
-        page_blocks = markdown_to_blocks(
-            page_text,
-            workspace_id=workspace_id,
-            document_id=document_id,
-            timestamp=timestamp,
-        )
-        page_document = page_blocks[0]
+    parsed_pages = _parse_pages(
+        page_texts,
+        workspace_id=workspace_id,
+        document_id=document_id,
+        timestamp=timestamp,
+        max_workers=max_workers,
+    )
+    for index, page_blocks in enumerate(parsed_pages, start=1):
         if document_block is None:
-            document_block = page_document
-
-        page_children = [block.id for block in page_blocks[1:] if block.parent_id == document_id]
-        children.extend(page_children)
+            document_block = page_blocks[0]
 
         group_id = page_groups.get(index)
-        for block in page_blocks[1:]:
+        for block in islice(page_blocks, 1, None):
+            if block.parent_id == document_id:
+                children.append(block.id)
             collected.append(_add_group(block, group_id))
 
     assert document_block is not None  # nosec - guarded by page_texts
@@ -294,33 +388,40 @@ def _tag_blocks_canonical(
     page_groups: dict[int, UUID],
     workspace_id: UUID | None,
     timestamp: datetime,
+    max_workers: int | None = None,
 ) -> list[Block]:
     if not page_texts or not page_groups or not blocks:
         return list(blocks)
 
     updated = list(blocks)
-    content_indices = [index for index, block in enumerate(updated) if _block_plain_text(block)]
+    content_indices: list[int] = []
+    positions_by_text: dict[str, deque[int]] = defaultdict(deque)
+    for index, block in enumerate(updated):
+        text = _block_normalised_text(block)
+        if text:
+            positions_by_text[text].append(len(content_indices))
+            content_indices.append(index)
     pointer = 0
 
-    for page_number, page_text in enumerate(page_texts, start=1):
-        group_id = page_groups.get(page_number)
-        if group_id is None:
-            continue
-        snippet_blocks = markdown_to_blocks(
-            page_text,
-            workspace_id=workspace_id,
-            document_id=uuid4(),
-            timestamp=timestamp,
-        )
-        snippet_texts = [
-            _normalise_text(text)
-            for text in (_block_plain_text(block) for block in snippet_blocks)
-            if text
-        ]
+    grouped_pages = [
+        (group_id, page_text)
+        for page_number, page_text in enumerate(page_texts, start=1)
+        if (group_id := page_groups.get(page_number)) is not None
+    ]
+    parsed_snippets = _parse_pages(
+        [page_text for _, page_text in grouped_pages],
+        workspace_id=workspace_id,
+        document_id=uuid4(),
+        timestamp=timestamp,
+        max_workers=max_workers,
+    )
+    for (group_id, _), snippet_blocks in zip(grouped_pages, parsed_snippets):
+        snippet_texts = [text for text in map(_block_normalised_text, snippet_blocks) if text]
         for snippet_text in snippet_texts:
             pointer = _assign_group_to_next_match(
                 updated,
                 content_indices,
+                positions_by_text,
                 pointer,
                 snippet_text,
                 group_id,
@@ -329,24 +430,66 @@ def _tag_blocks_canonical(
     return updated
 
 
+def _parse_pages(
+    page_texts: Sequence[str],
+    *,
+    workspace_id: UUID | None,
+    document_id: UUID,
+    timestamp: datetime,
+    max_workers: int | None = None,
+) -> list[list[Block]]:
+    """Parse each page independently, on the shared page pool when opted in."""
+    parse = partial(
+        markdown_to_blocks,
+        workspace_id=workspace_id,
+        document_id=document_id,
+        timestamp=timestamp,
+    )
+    if not max_workers or max_workers <= 1 or len(page_texts) < _PARALLEL_PAGE_THRESHOLD:
+        return [parse(page_text) for page_text in page_texts]
+    return list(_page_pool(max_workers).map(parse, page_texts))
+
+
+def _page_pool(max_workers: int) -> ProcessPoolExecutor:
+    with _PAGE_POOLS_LOCK:
+        pool = _PAGE_POOLS.get(max_workers)
+        if pool is None:
+            pool = _PAGE_POOLS[max_workers] = ProcessPoolExecutor(max_workers=max_workers)
+        return pool
+
+
+@atexit.register
+def _shutdown_page_pools() -> None:
+    with _PAGE_POOLS_LOCK:
+        pools = list(_PAGE_POOLS.values())
+        _PAGE_POOLS.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
 def _assign_group_to_next_match(
     blocks: list[Block],
     content_indices: list[int],
+    positions_by_text: dict[str, deque[int]],
     pointer: int,
     target_text: str,
     group_id: UUID,
 ) -> int:
-    total = len(content_indices)
-    normalised_target = _normalise_text(target_text)
-    while pointer < total:
-        block_index = content_indices[pointer]
-        pointer += 1
-        block = blocks[block_index]
-        block_text = _block_plain_text(block)
-        if block_text and _normalise_text(block_text) == normalised_target:
-            blocks[block_index] = _add_group(block, group_id)
-            break
-    return pointer
+    """Tag the first content block at or after ``pointer`` whose text matches.
+
+    ``positions_by_text`` maps normalised text to ascending positions in
+    ``content_indices``; positions behind the pointer can never match again and
+    are dropped. Without a match the pointer moves past every block.
+    """
+    positions = positions_by_text.get(target_text)
+    while positions and positions[0] < pointer:
+        positions.popleft()
+    if not positions:
+        return len(content_indices)
+    position = positions.popleft()
+    block_index = content_indices[position]
+    blocks[block_index] = _add_group(blocks[block_index], group_id)
+    return position + 1
 
 
 def _attach_page_group_blocks(blocks: Sequence[Block], page_groups: dict[int, UUID]) -> list[Block]:
@@ -354,12 +497,10 @@ def _attach_page_group_blocks(blocks: Sequence[Block], page_groups: dict[int, UU
         return list(blocks)
 
     document = blocks[0]
-    child_ids = list(document.children_ids)
     group_index_id = uuid4()
-    child_ids.append(group_index_id)
-    document = document.model_copy(update={"children_ids": tuple(child_ids)})
+    document = document.model_copy(update={"children_ids": (*document.children_ids, group_index_id)})
 
-    sorted_pages = [number for number in sorted(page_groups)]
+    sorted_pages = sorted(page_groups)
     group_children = tuple(page_groups[number] for number in sorted_pages)
     base_kwargs = {
         "root_id": document.root_id,
@@ -394,8 +535,8 @@ def _attach_page_group_blocks(blocks: Sequence[Block], page_groups: dict[int, UU
             )
         )
 
-    updated = [document]
-    updated.extend(blocks[1:])
+    updated = list(blocks)
+    updated[0] = document
     updated.append(group_index)
     updated.extend(page_blocks)
     return updated
@@ -415,10 +556,9 @@ def _add_group(block: Block, group_id: UUID | None) -> Block:
     return block.model_copy(update={"properties": new_props})
 
 
-def _block_plain_text(block: Block) -> str | None:
+def _block_normalised_text(block: Block) -> str | None:
     if block.content and block.content.plain_text:
-        text = block.content.plain_text.strip()
-        return text if text else None
+        return _normalise_text(block.content.plain_text) or None
     return None
 
 
@@ -427,13 +567,11 @@ def _normalise_text(text: str) -> str:
 
 
 def _remove_marker_html_blocks(blocks: Sequence[Block]) -> list[Block]:
-    pattern = re.compile(
-        r"^\s*<!--\s*(PageBreak|PageNumber\s*=\s*\".*?\"|PageFooter\s*=\s*\".*?\")\s*-->\s*$"
-    )
     ids_to_remove: set[UUID] = set()
     for block in blocks:
         if block.type is BlockType.HTML and block.content and block.content.plain_text:
-            if pattern.match(block.content.plain_text.strip()):
+            text = block.content.plain_text.strip()
+            if "<!--" in text and _MARKER_HTML_RE.match(text):
                 ids_to_remove.add(block.id)
     if not ids_to_remove:
         return list(blocks)
@@ -442,10 +580,9 @@ def _remove_marker_html_blocks(blocks: Sequence[Block]) -> list[Block]:
     for block in blocks:
         if block.id in ids_to_remove:
             continue
-        if block.children_ids:
+        if not ids_to_remove.isdisjoint(block.children_ids):
             children = tuple(child_id for child_id in block.children_ids if child_id not in ids_to_remove)
-            if children != block.children_ids:
-                block = block.model_copy(update={"children_ids": children})
+            block = block.model_copy(update={"children_ids": children})
         updated.append(block)
     return updated
 
@@ -454,12 +591,14 @@ def _with_metadata(blocks: Sequence[Block], payload: dict[str, Any], grouping: s
     if not blocks:
         return list(blocks)
     document = blocks[0]
-    metadata = dict(document.metadata)
+    current = document.metadata
+    if "source" in current and current.get("grouping") == grouping:
+        return list(blocks)
+    metadata = dict(current)
     metadata.setdefault("source", payload.get("source_name") or "azure_di")
     metadata["grouping"] = grouping
-    updated_document = document.model_copy(update={"metadata": metadata})
-    updated = [updated_document]
-    updated.extend(blocks[1:])
+    updated = list(blocks)
+    updated[0] = document.model_copy(update={"metadata": metadata})
     return updated
 
 
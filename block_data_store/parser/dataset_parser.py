@@ -12,6 +12,8 @@ from uuid import UUID, uuid4
 from block_data_store.models.block import Block, Content
 from block_data_store.models.blocks import DatasetBlock, DatasetProps, RecordBlock, RecordProps
 
+from ._uuids import bulk_uuid4
+
 
 @dataclass(slots=True)
 class DatasetParserConfig:
@@ -45,31 +47,34 @@ def dataset_to_blocks(
             raise ValueError(f"Missing columns in dataset source: {missing}")
         df = df[cfg.select_columns]
 
-    df = df.where(df.notna(), None)
-    records = df.to_dict(orient="records")
-
-    record_blocks: list[Block] = []
-    record_ids: list[UUID] = []
-    for row in records:
-        record_id = uuid4()
-        record_ids.append(record_id)
-        record_blocks.append(
-            RecordBlock(
-                id=record_id,
-                parent_id=dataset_id,
-                root_id=dataset_id,
-                children_ids=tuple(),
-                workspace_id=workspace_id,
-                version=0,
-                created_time=timestamp,
-                last_edited_time=timestamp,
-                created_by=None,
-                last_edited_by=None,
-                properties=RecordProps(),
-                metadata={},
-                content=Content(data=row),
-            )
+    columns = list(df.columns)
+    df = _missing_to_none(df)
+    records = [dict(zip(columns, row)) for row in df.itertuples(index=False, name=None)]
+
+    # Rows are plain values from pandas, so records are built without re-validation.
+    # Props stay per record: their ``groups`` list is mutable.
+    record_ids = bulk_uuid4(len(records))
+    build_props = RecordProps.model_construct
+    build_record = RecordBlock.model_construct
+    build_content = Content.model_construct
+    record_blocks: list[Block] = [
+        build_record(
+            id=record_id,
+            parent_id=dataset_id,
+            root_id=dataset_id,
+            children_ids=(),
+            workspace_id=workspace_id,
+            version=0,
+            created_time=timestamp,
+            last_edited_time=timestamp,
+            created_by=None,
+            last_edited_by=None,
+            properties=build_props(),
+            metadata={},
+            content=build_content(data=row),
         )
+        for record_id, row in zip(record_ids, records)
+    ]
 
     metadata = {"source": "dataset_parser"}
     if source_name:
@@ -136,6 +141,9 @@ def _load_dataframe(
     if config.sheet_name is not None and "sheet_name" not in kwargs:
         kwargs["sheet_name"] = config.sheet_name
 
+    # pandas' default engines decide how dates and numbers are typed; faster ones
+    # (pyarrow for CSV, calamine for Excel) infer differently, so callers opt in
+    # explicitly via ``read_kwargs={"engine": ...}``.
     if reader == "excel":
         dataframe = pandas.read_excel(data_input, **kwargs)
     else:
@@ -145,6 +153,22 @@ def _load_dataframe(
     return dataframe, name
 
 
+def _missing_to_none(df):
+    """Replace missing cells with ``None``, touching only columns that have any.
+
+    Those columns are cast to object first so the ``None`` survives on every
+    pandas version; the rest already yield plain Python scalars.
+    """
+    missing = [position for position in range(df.shape[1]) if df.iloc[:, position].hasnans]
+    if not missing:
+        return df
+    df = df.copy(deep=False)
+    for position in missing:
+        column = df.iloc[:, position]
+        df.isetitem(position, column.astype(object).where(column.notna(), None))
+    return df
+
+
 def _determine_reader(desired: Literal["auto", "csv", "excel"], path: Path | None) -> Literal["csv", "excel"]:
     if desired != "auto":
         return desired
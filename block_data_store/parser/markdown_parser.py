@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
+import threading
+from typing import Any, Callable, Iterable, Iterator
 from uuid import UUID, uuid4
 
 import mistune
@@ -19,15 +23,33 @@ from block_data_store.models.block import (
     properties_model_for,
 )
 
+from ._uuids import UUIDBatch
+
 MarkdownAst = list[dict[str, Any]]
 
 _DEFAULT_PLUGINS: tuple[str, ...] = ("table",)
+_PARSER: mistune.Markdown | None = None
+_PARSER_LOCK = threading.Lock()
+_BREAK_TYPES = frozenset({"softbreak", "linebreak"})
+_SKIP_TYPES = frozenset({"blank_line", "linebreak", "softbreak"})
+_LIST_TEXT_TYPES = frozenset({"block_text", "paragraph"})
+_ALIGNMENTS = frozenset({"left", "center", "right"})
+_ALIGNMENT_BY_VALUE: dict[str | None, str | None] = {None: None, "left": "left", "center": "center", "right": "right"}
 
 
 def parse_markdown(source: str) -> MarkdownAst:
     """Return Mistune's AST for the provided Markdown source."""
-    markdown = mistune.create_markdown(renderer="ast", plugins=_DEFAULT_PLUGINS)
-    return markdown(source)
+    return _get_parser()(source)
+
+
+def _get_parser() -> mistune.Markdown:
+    # Built on first use; parsing keeps its state per call, so one instance is shared.
+    global _PARSER
+    if _PARSER is None:
+        with _PARSER_LOCK:
+            if _PARSER is None:
+                _PARSER = mistune.create_markdown(renderer="ast", plugins=list(_DEFAULT_PLUGINS))
+    return _PARSER
 
 
 def markdown_to_blocks(
@@ -55,7 +77,9 @@ def load_markdown_path(
     timestamp: datetime | None = None,
 ) -> list[Block]:
     """Read Markdown from disk and convert to blocks."""
-    content = Path(path).read_text(encoding="utf-8")
+    content = Path(path).read_bytes().decode("utf-8")
+    if "\r" in content:  # same newlines read_text() would produce
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
     return markdown_to_blocks(
         content,
         workspace_id=workspace_id,
@@ -64,6 +88,26 @@ def load_markdown_path(
     )
 
 
+def load_markdown_paths(
+    paths: Iterable[str | Path],
+    *,
+    workspace_id: UUID | None = None,
+    timestamp: datetime | None = None,
+    max_workers: int | None = None,
+) -> Iterator[list[Block]]:
+    """Read and convert many Markdown files across worker processes, in input order.
+
+    Every file becomes its own document with a freshly generated id. All paths
+    are submitted to the pool as soon as iteration starts, so results are only
+    streamed back, not produced on demand; closing the iterator early still
+    waits for the queued files to finish.
+    """
+    timestamp = timestamp or datetime.now(timezone.utc)
+    load = partial(load_markdown_path, workspace_id=workspace_id, timestamp=timestamp)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(load, paths, chunksize=8)
+
+
 def ast_to_blocks(
     tokens: MarkdownAst,
     *,
@@ -75,11 +119,44 @@ def ast_to_blocks(
     document_id = document_id or uuid4()
     timestamp = timestamp or datetime.now(timezone.utc)
 
-    nodes: list[dict[str, Any]] = []
-    by_id: dict[UUID, dict[str, Any]] = {}
-    children: dict[UUID, list[UUID]] = defaultdict(list)
+    builder = _NodeBuilder(document_id)
+    builder.add_node(
+        BlockType.DOCUMENT,
+        None,
+        properties=builder.document_props,
+        node_id=document_id,
+    )
+
+    _process_tokens(tokens, _Scope(builder, document_id, [], allow_document_title=True))
+
+    return _realise_blocks(builder.nodes, builder.children, workspace_id, document_id, timestamp)
+
+
+@dataclass(slots=True)
+class _Node:
+    id: UUID
+    type: BlockType
+    parent_id: UUID | None
+    properties: dict[str, Any] | None  # None until a node has any, to skip empty dicts
+    metadata: dict[str, Any] | None
+    content: Content | None
+
+
+class _NodeBuilder:
+    """Collects parsed nodes in document order along with their child links."""
+
+    __slots__ = ("document_id", "document_props", "nodes", "by_id", "children", "_ids")
+
+    def __init__(self, document_id: UUID) -> None:
+        self.document_id = document_id
+        self._ids = UUIDBatch()
+        self.document_props: dict[str, Any] = {}
+        self.nodes: list[_Node] = []
+        self.by_id: dict[UUID, _Node] = {}
+        self.children: dict[UUID, list[UUID]] = defaultdict(list)
 
     def add_node(
+        self,
         block_type: BlockType,
         parent_id: UUID | None,
         *,
@@ -88,120 +165,101 @@ def ast_to_blocks(
         content: Content | None = None,
         node_id: UUID | None = None,
     ) -> UUID:
-        block_id = node_id or uuid4()
-        record = {
-            "id": block_id,
-            "type": block_type,
-            "parent_id": parent_id,
-            "properties": properties if properties is not None else {},
-            "metadata": metadata if metadata is not None else {},
-            "content": content,
-        }
-        nodes.append(record)
-        by_id[block_id] = record
+        block_id = node_id or self._ids.next()
+        node = _Node(
+            block_id,
+            block_type,
+            parent_id,
+            properties,
+            metadata,
+            content,
+        )
+        self.nodes.append(node)
+        self.by_id[block_id] = node
         if parent_id is not None:
-            children[parent_id].append(block_id)
+            self.children[parent_id].append(block_id)
         return block_id
 
-    document_props: dict[str, Any] = {}
-    document_node_id = add_node(
-        BlockType.DOCUMENT,
-        None,
-        properties=document_props,
-        node_id=document_id,
-    )
-    heading_stack: list[tuple[int, UUID]] = []
-
-    _process_tokens(
-        tokens,
-        default_parent=document_node_id,
-        heading_stack=heading_stack,
-        add_node=add_node,
-        by_id=by_id,
-        document_id=document_node_id,
-        document_props=document_props,
-    )
 
-    return _realise_blocks(nodes, children, workspace_id, document_id, timestamp)
+@dataclass(slots=True)
+class _Scope:
+    """Where a run of sibling tokens attaches: its container and open headings."""
 
+    builder: _NodeBuilder
+    default_parent: UUID
+    heading_stack: list[tuple[int, UUID]]
+    allow_document_title: bool = False
+
+    def content_parent(self) -> UUID:
+        if self.heading_stack:
+            return self.heading_stack[-1][1]
+        return self.default_parent
 
-def _process_tokens(
-    tokens: MarkdownAst,
-    *,
-    default_parent: UUID,
-    heading_stack: list[tuple[int, UUID]] | None,
-    add_node: Any,
-    by_id: dict[UUID, dict[str, Any]],
-    document_id: UUID,
-    document_props: dict[str, Any],
-) -> None:
-    local_heading_stack = heading_stack if heading_stack is not None else []
 
+def _process_tokens(tokens: MarkdownAst, scope: _Scope) -> None:
     for token in tokens:
         token_type = token.get("type")
-        if token_type in {"blank_line", "linebreak", "softbreak"}:
+        if token_type in _SKIP_TYPES:
             continue
+        handler = _TOKEN_HANDLERS.get(token_type, _handle_fallback)
+        handler(scope, token)
 
-        if token_type == "heading":
-            _append_heading(
-                add_node,
-                token,
-                local_heading_stack,
-                default_parent=default_parent,
-                document_id=document_id,
-                document_props=document_props,
-                allow_document_title=heading_stack is not None,
-            )
-            continue
 
-        parent_id = _parent_for_content(local_heading_stack, default_parent)
+def _handle_heading(scope: _Scope, token: dict[str, Any]) -> None:
+    _append_heading(scope, token)
 
-        if token_type == "paragraph":
-            _append_paragraph(add_node, parent_id, token)
-            continue
 
-        if token_type == "list":
-            _emit_list(add_node, parent_id, token, by_id)
-            continue
+def _handle_paragraph(scope: _Scope, token: dict[str, Any]) -> None:
+    _append_paragraph(scope.builder, scope.content_parent(), token)
 
-        if token_type == "block_code":
-            _append_code(add_node, parent_id, token)
-            continue
 
-        if token_type == "block_quote":
-            quote_id = add_node(BlockType.QUOTE, parent_id)
-            _process_tokens(
-                token.get("children", []),
-                default_parent=quote_id,
-                heading_stack=None,
-                add_node=add_node,
-                by_id=by_id,
-                document_id=document_id,
-                document_props=document_props,
-            )
-            continue
+def _handle_list(scope: _Scope, token: dict[str, Any]) -> None:
+    _emit_list(scope.builder, scope.content_parent(), token)
 
-        if token_type in {"html_block", "block_html"}:
-            _append_html(add_node, parent_id, token)
-            continue
 
-        if token_type == "table":
-            _append_table(add_node, parent_id, token)
-            continue
+def _handle_code(scope: _Scope, token: dict[str, Any]) -> None:
+    _append_code(scope.builder, scope.content_parent(), token)
+
+
+def _handle_quote(scope: _Scope, token: dict[str, Any]) -> None:
+    quote_id = scope.builder.add_node(BlockType.QUOTE, scope.content_parent())
+    _process_tokens(token.get("children", []), _Scope(scope.builder, quote_id, []))
+
+
+def _handle_html(scope: _Scope, token: dict[str, Any]) -> None:
+    _append_html(scope.builder, scope.content_parent(), token)
+
+
+def _handle_table(scope: _Scope, token: dict[str, Any]) -> None:
+    _append_table(scope.builder, scope.content_parent(), token)
+
 
-        fallback = _extract_text(token).strip()
-        if fallback:
-            _append_paragraph(add_node, parent_id, {"raw": fallback})
+def _handle_fallback(scope: _Scope, token: dict[str, Any]) -> None:
+    fallback = _extract_text(token).strip()
+    if fallback:
+        _append_paragraph(scope.builder, scope.content_parent(), {"raw": fallback})
+
+
+_TOKEN_HANDLERS: dict[str, Callable[[_Scope, dict[str, Any]], None]] = {
+    "heading": _handle_heading,
+    "paragraph": _handle_paragraph,
+    "list": _handle_list,
+    "block_code": _handle_code,
+    "block_quote": _handle_quote,
+    "html_block": _handle_html,
+    "block_html": _handle_html,
+    "table": _handle_table,
+}
 
 
 def _append_paragraph(
-    add_node: Any,
+    builder: _NodeBuilder,
     parent_id: UUID,
     token: dict[str, Any],
 ) -> None:
     text = _extract_text(token).strip()
     if text:
-        add_node(
+        builder.add_node(
             BlockType.PARAGRAPH,
             parent_id,
             content=Content(plain_text=text),
@@ -209,76 +267,59 @@ def _append_paragraph(
 
 
 def _emit_list(
-    add_node: Any,
+    builder: _NodeBuilder,
     parent_id: UUID,
     token: dict[str, Any],
-    by_id: dict[UUID, dict[str, Any]],
 ) -> None:
-    ordered = bool(token.get("attrs", {}).get("ordered", False))
-    item_type = BlockType.NUMBERED_LIST_ITEM if ordered else BlockType.BULLETED_LIST_ITEM
-
-    items = [child for child in token.get("children", []) if child.get("type") == "list_item"]
-    for index, item in enumerate(items, start=1):
-        item_id = add_node(
-            item_type,
-            parent_id,
-        )
-        item_node = by_id[item_id]
-
-        content_assigned = False
-        for child in item.get("children", []):
+    item_type = _list_item_type(token)
+    for item in token.get("children", ()):
+        if item.get("type") != "list_item":
+            continue
+        item_id = builder.add_node(item_type, parent_id)
+        item_node = builder.by_id[item_id]
+        for child in item.get("children", ()):
             child_type = child.get("type")
-            if child_type in {"block_text", "paragraph"}:
-                text = _extract_text(child).strip()
-                if not text:
-                    continue
-                if not content_assigned:
-                    item_node["content"] = Content(plain_text=text)
-                    content_assigned = True
-                else:
-                    _append_paragraph(add_node, item_id, {"raw": text})
-            elif child_type == "list":
-                _emit_list(add_node, item_id, child, by_id)
+            if child_type == "list":
+                _emit_list(builder, item_id, child)
+                continue
+            text = _extract_text(child).strip()
+            if not text:
+                continue
+            # The first text child becomes the item's own text; anything else is a paragraph.
+            if child_type in _LIST_TEXT_TYPES and item_node.content is None:
+                item_node.content = Content(plain_text=text)
             else:
-                text = _extract_text(child).strip()
-                if text:
-                    _append_paragraph(add_node, item_id, {"raw": text})
+                _append_paragraph(builder, item_id, {"raw": text})
 
 
-def _parent_for_content(
-    heading_stack: list[tuple[int, UUID]] | None,
-    fallback_parent: UUID,
-) -> UUID:
-    if heading_stack:
-        return heading_stack[-1][1]
-    return fallback_parent
+def _list_item_type(token: dict[str, Any]) -> BlockType:
+    ordered = bool(token.get("attrs", {}).get("ordered", False))
+    return BlockType.NUMBERED_LIST_ITEM if ordered else BlockType.BULLETED_LIST_ITEM
 
 
-def _append_heading(
-    add_node: Any,
-    token: dict[str, Any],
-    heading_stack: list[tuple[int, UUID]],
-    *,
-    default_parent: UUID,
-    document_id: UUID,
-    document_props: dict[str, Any],
-    allow_document_title: bool,
-) -> None:
+def _append_heading(scope: _Scope, token: dict[str, Any]) -> None:
     level = int(token.get("attrs", {}).get("level", 1))
     text = _extract_text(token).strip()
     if not text:
         return
 
-    if allow_document_title and default_parent == document_id and level == 1 and not document_props.get("title"):
-        document_props["title"] = text
+    builder = scope.builder
+    heading_stack = scope.heading_stack
+    if (
+        scope.allow_document_title
+        and scope.default_parent == builder.document_id
+        and level == 1
+        and not builder.document_props.get("title")
+    ):
+        builder.document_props["title"] = text
         heading_stack.clear()
         return
 
     while heading_stack and heading_stack[-1][0] >= level:
         heading_stack.pop()
 
-    parent_id = heading_stack[-1][1] if heading_stack else default_parent
-    heading_id = add_node(
+    parent_id = heading_stack[-1][1] if heading_stack else scope.default_parent
+    heading_id = builder.add_node(
         BlockType.HEADING,
         parent_id,
         properties={"level": level},
@@ -288,7 +329,7 @@ def _append_heading(
 
 
 def _append_code(
-    add_node: Any,
+    builder: _NodeBuilder,
     parent_id: UUID,
     token: dict[str, Any],
 ) -> None:
@@ -298,7 +339,7 @@ def _append_code(
         return
 
     properties = {"language": info or None}
-    add_node(
+    builder.add_node(
         BlockType.CODE,
         parent_id,
         properties=properties,
@@ -307,14 +348,14 @@ def _append_code(
 
 
 def _append_html(
-    add_node: Any,
+    builder: _NodeBuilder,
     parent_id: UUID,
     token: dict[str, Any],
 ) -> None:
     raw_text = (token.get("raw") or "").rstrip("\n")
     if not raw_text:
         return
-    add_node(
+    builder.add_node(
         BlockType.HTML,
         parent_id,
         content=Content(plain_text=raw_text),
@@ -322,7 +363,7 @@ def _append_html(
 
 
 def _append_table(
-    add_node: Any,
+    builder: _NodeBuilder,
     parent_id: UUID,
     token: dict[str, Any],
 ) -> None:
@@ -348,7 +389,7 @@ def _append_table(
     if alignments:
         table_object["align"] = alignments
 
-    add_node(
+    builder.add_node(
         BlockType.TABLE,
         parent_id,
         content=Content(object=table_object),
@@ -390,39 +431,45 @@ def _table_section_rows(section: dict[str, Any]) -> tuple[list[list[str]], list[
 
 
 def _normalise_alignment(value: Any) -> str | None:
-    if value is None:
-        return None
+    # Mistune only emits these exact values; anything else takes the slow path.
+    if value in _ALIGNMENT_BY_VALUE:
+        return _ALIGNMENT_BY_VALUE[value]
     text = str(value).lower()
-    if text in {"left", "center", "right"}:
+    if text in _ALIGNMENTS:
         return text
     return None
 
 
 def _realise_blocks(
-    nodes: list[dict[str, Any]],
+    nodes: list[_Node],
     children: dict[UUID, list[UUID]],
     workspace_id: UUID | None,
     document_id: UUID,
     timestamp: datetime,
 ) -> list[Block]:
     realised: list[Block] = []
+    classes: dict[BlockType, tuple[type[Block], type[BlockProperties]]] = {}
     for record in nodes:
-        block_type: BlockType = record["type"]
-        block_cls = block_class_for(block_type)
-        properties = record["properties"]
+        block_type = record.type
+        resolved = classes.get(block_type)
+        if resolved is None:
+            resolved = classes[block_type] = (block_class_for(block_type), properties_model_for(block_type))
+        block_cls, props_cls = resolved
+        properties = record.properties
 
         if isinstance(properties, BlockProperties):
             props_model = properties
         else:
-            props_cls = properties_model_for(block_type) or BlockProperties
-            props_model = props_cls(**properties)
+            props_model = props_cls.model_construct(**properties) if properties else props_cls.model_construct()
 
-        block = block_cls(
-            id=record["id"],
+        # Parser output is well-formed by construction, so validation is skipped.
+        child_ids = children.get(record.id)
+        block = block_cls.model_construct(
+            id=record.id,
             type=block_type,
-            parent_id=record["parent_id"],
+            parent_id=record.parent_id,
             root_id=document_id,
-            children_ids=tuple(children.get(record["id"], [])),
+            children_ids=tuple(child_ids) if child_ids else (),
             workspace_id=workspace_id,
             version=0,
             created_time=timestamp,
@@ -430,23 +477,28 @@ def _realise_blocks(
             created_by=None,
             last_edited_by=None,
             properties=props_model,
-            metadata=dict(record["metadata"]),
-            content=record["content"],
+            metadata=record.metadata if record.metadata is not None else {},
+            content=record.content,
         )
         realised.append(block)
     return realised
 
 
 def _extract_text(token: dict[str, Any]) -> str:
-    token_type = token.get("type")
-    if token_type in {"softbreak", "linebreak"}:
-        return "\n"
-    raw = token.get("raw")
-    if isinstance(raw, str):
-        return raw
     parts: list[str] = []
-    for child in token.get("children", []):
-        parts.append(_extract_text(child))
+    stack = [token]
+    while stack:
+        current = stack.pop()
+        if current.get("type") in _BREAK_TYPES:
+            parts.append("\n")
+            continue
+        raw = current.get("raw")
+        if isinstance(raw, str):
+            parts.append(raw)
+            continue
+        children = current.get("children")
+        if children:
+            stack.extend(reversed(children))
     return "".join(parts)
 
 
@@ -456,4 +508,5 @@ __all__ = [
     "markdown_to_blocks",
     "ast_to_blocks",
     "load_markdown_path",
+    "load_markdown_paths",
 ]
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Mapping, Protocol
+from typing import Any, ClassVar, Mapping, Protocol
 
 from block_data_store.models.block import Block
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RenderOptions:
     recursive: bool = True
     include_metadata: bool = False
 
+    DEFAULT: ClassVar[RenderOptions]
+
+
+RenderOptions.DEFAULT = RenderOptions()
+
 
 class Renderer(Protocol):
     def render(
@@ -7,9 +7,14 @@ from dataclasses import dataclass
 from typing import Any, Mapping, Sequence, TYPE_CHECKING
 from uuid import UUID
 
-from block_data_store.models.block import Block, BlockType, Content
+from block_data_store.models.block import Block, BlockType
 from block_data_store.renderers.base import RenderOptions, RendererComponent
 
+try:  # Optional fast JSON serialiser
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from .renderer import MarkdownRenderer
 
@@ -17,6 +22,9 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
 # ---------------------------------------------------------------------------
 # Rendering context & base component
 
+# Private ``extra`` key holding per-render numbered-list ordinals by parent id.
+_ORDINALS_KEY = "_ordered_index"
+
 
 @dataclass(slots=True)
 class RenderContext:
@@ -24,36 +32,25 @@ class RenderContext:
     options: RenderOptions
     extra: Mapping[str, Any]
 
-    def child_kwargs(self) -> dict[str, Any]:
-        return dict(self.extra)
-
     def render_children(self, block: Block) -> list[str]:
         if not self.options.recursive:
             return []
-        child_kwargs = self.child_kwargs()
-        rendered_children = [
-            self.engine.render(child, options=self.options, **child_kwargs)
-            for child in block.children()
-        ]
-        return [child for child in rendered_children if child.strip()]
+        return self.render_blocks(block.id, block.children())
+
+    def render_blocks(self, parent_id: UUID, children: Sequence[Block]) -> list[str]:
+        """Render sibling blocks, seeding their numbered-list ordinals first."""
+        cache = self.extra.get(_ORDINALS_KEY)
+        if cache is not None and parent_id not in cache:
+            cache[parent_id] = _numbered_ordinals(children)
+        rendered_children = [self.render_block(child) for child in children]
+        return [child for child in rendered_children if child]
 
     def join(self, sections: Sequence[str]) -> str:
-        cleaned = [section.strip() for section in sections if section and section.strip()]
-        if not cleaned:
-            return ""
-        output = cleaned[0]
-        for section in cleaned[1:]:
-            separator = "\n\n"
-            prev_kind = _section_kind(output.splitlines()[-1])
-            next_kind = _section_kind(section.splitlines()[0])
-            if prev_kind and prev_kind == next_kind and prev_kind in {"bullet", "numbered"}:
-                separator = "\n"
-            output = f"{output}{separator}{section}"
-        return output
+        return join_sections(sections)
 
     def indent(self, text: str, *, spaces: int = 4) -> str:
         indent = " " * spaces
-        return "\n".join(f"{indent}{line}" if line else line for line in text.splitlines())
+        return "\n".join([f"{indent}{line}" if line else line for line in text.splitlines()])
 
     def quote(self, text: str) -> str:
         lines = text.splitlines() or [""]
@@ -61,7 +58,7 @@ class RenderContext:
         return "\n".join(quoted)
 
     def render_block(self, block: Block) -> str:
-        return self.engine.render(block, options=self.options, **self.child_kwargs())
+        return self.engine._render_block(block, self.options, self.extra).strip()
 
 
 class BaseComponent(RendererComponent):
@@ -88,22 +85,20 @@ class DocumentComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
         title = getattr(block.properties, "title", None)
         heading = f"# {title}" if title else f"# Document {block.id}"
+        children = [
+            child
+            for child in block.children()
+            if child.type not in {BlockType.GROUP_INDEX, BlockType.PAGE_GROUP}
+        ]
         sections = [heading]
-        for child in block.children():
-            if child.type in {BlockType.GROUP_INDEX, BlockType.PAGE_GROUP}:
-                continue
-            rendered = ctx.render_block(child)
-            if rendered.strip():
-                sections.append(rendered)
+        sections.extend(ctx.render_blocks(block.id, children))
         return ctx.join(sections)
 
 
 class HeadingComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
-        props = block.properties
-        level = getattr(props, "level", 2) if props is not None else 2
-        level = max(1, min(level, 6))
-        text = block.content.plain_text if block.content and block.content.plain_text else f"Heading {block.id}"
+        level = max(1, min(getattr(block.properties, "level", 2), 6))
+        text = _text_of(block) or f"Heading {block.id}"
         prefix = "#" * level
         sections = [f"{prefix} {text}"]
         sections.extend(ctx.render_children(block))
@@ -112,7 +107,7 @@ class HeadingComponent(BaseComponent):
 
 class ParagraphComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
-        text = block.content.plain_text if block.content and block.content.plain_text else ""
+        text = _text_of(block)
         sections = [text] if text else []
         sections.extend(ctx.render_children(block))
         return ctx.join(sections)
@@ -122,8 +117,8 @@ class QuoteComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
         sections = ctx.render_children(block)
         body = ctx.join(sections)
-        if not body and block.content and block.content.plain_text:
-            body = block.content.plain_text
+        if not body:
+            body = _text_of(block)
         if not body:
             return ""
         return ctx.quote(body)
@@ -132,7 +127,7 @@ class QuoteComponent(BaseComponent):
 class CodeComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
         language = getattr(block.properties, "language", None) or ""
-        code_text = block.content.plain_text if block.content and block.content.plain_text else ""
+        code_text = _text_of(block)
         fence = f"```{language}" if language else "```"
         section = "\n".join([fence, code_text, "```"]).strip("\n")
         sections = [section]
@@ -142,14 +137,14 @@ class CodeComponent(BaseComponent):
 
 class TableComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
-        table = block.content.object if block.content and block.content.object else {}
-        headers = list(table.get("headers") or [])
-        rows = [list(row) for row in table.get("rows") or []]
+        table = _object_of(block)
+        headers = table.get("headers") or []
+        rows = table.get("rows") or []
         width = len(headers) or (len(rows[0]) if rows else 0)
         if width == 0:
             return ""
         alignments = table.get("align") or []
-        header_line = format_table_row(headers or ["" for _ in range(width)], width)
+        header_line = format_table_row(headers, width)
         align_line = format_alignment_row(alignments, width)
         body_lines = [format_table_row(row, width) for row in rows]
         sections = ["\n".join([header_line, align_line, *body_lines])]
@@ -159,7 +154,7 @@ class TableComponent(BaseComponent):
 
 class HtmlComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
-        html_text = block.content.plain_text if block.content and block.content.plain_text else ""
+        html_text = _text_of(block)
         sections = [html_text] if html_text else []
         sections.extend(ctx.render_children(block))
         return ctx.join(sections)
@@ -191,17 +186,13 @@ class DatasetComponent(BaseComponent):
         elif not columns:
             sections.append("_No records_")
 
-        for child in other_children:
-            rendered = ctx.render_block(child)
-            if rendered.strip():
-                sections.append(rendered)
-
+        sections.extend(ctx.render_blocks(block.id, other_children))
         return ctx.join(sections)
 
 
 class RecordComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
-        data = block.content.data if block.content and block.content.data else {}
+        data = _data_of(block)
         if not data:
             return ""
         ordered_keys = list(data.keys())
@@ -212,16 +203,13 @@ class RecordComponent(BaseComponent):
 class ObjectComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
         sections: list[str] = []
-        summary = None
-        if block.content and block.content.plain_text:
-            summary = block.content.plain_text
-        elif getattr(block.properties, "category", None):
-            summary = getattr(block.properties, "category")
+        summary = _text_of(block) or getattr(block.properties, "category", None)
         if summary:
             sections.append(summary)
 
-        if block.content and block.content.object:
-            payload = json.dumps(block.content.object, indent=2, sort_keys=True)
+        payload_object = _object_of(block)
+        if payload_object:
+            payload = _pretty_json(payload_object)
             sections.append("\n".join(["```json", payload, "```"]))
 
         sections.extend(ctx.render_children(block))
@@ -241,7 +229,7 @@ class UnsupportedComponent(BaseComponent):
 class GenericComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
         label = getattr(block.properties, "title", None) or block.type.value
-        text = block.content.plain_text if isinstance(block.content, Content) and block.content.plain_text else ""
+        text = _text_of(block)
         sections = [f"### {label}"]
         if text:
             sections.append(text)
@@ -255,10 +243,17 @@ class PageGroupComponent(BaseComponent):
         projected = _project_group_forest(root, block.id)
         if not projected:
             return ""
+        # Projected clones reuse their source ids with filtered children, so
+        # they must not share ordinals with the source tree.
+        projection_ctx = RenderContext(
+            engine=ctx.engine,
+            options=ctx.options,
+            extra={**ctx.extra, _ORDINALS_KEY: {}},
+        )
         sections: list[str] = []
         for candidate in projected:
-            rendered = ctx.engine.render(candidate, options=ctx.options, **ctx.child_kwargs())
-            if rendered.strip():
+            rendered = projection_ctx.render_block(candidate)
+            if rendered:
                 sections.append(rendered)
         return ctx.join(sections)
 
@@ -268,12 +263,7 @@ class GroupIndexComponent(BaseComponent):
         index_type = getattr(block.properties, "group_index_type", None)
         if index_type != "page":
             return ""
-        sections: list[str] = []
-        for child in block.children():
-            rendered = ctx.render_block(child)
-            if rendered.strip():
-                sections.append(rendered)
-        return ctx.join(sections)
+        return ctx.join(ctx.render_blocks(block.id, block.children()))
 
 
 class BulletedListItemComponent(BaseComponent):
@@ -281,25 +271,17 @@ class BulletedListItemComponent(BaseComponent):
         text = _block_text(block)
         line = f"* {text}".rstrip()
         sections = [line]
-        for child in block.children():
-            rendered = ctx.render_block(child)
-            if not rendered.strip():
-                continue
-            sections.append(ctx.indent(rendered))
+        sections.extend(ctx.indent(rendered) for rendered in ctx.render_blocks(block.id, block.children()))
         return "\n".join(sections)
 
 
 class NumberedListItemComponent(BaseComponent):
     def render_block(self, block: Block, ctx: RenderContext) -> str:
-        index = _ordered_index(block)
+        index = _ordered_index(block, ctx.extra.get(_ORDINALS_KEY))
         text = _block_text(block)
         line = f"{index}. {text}".rstrip()
         sections = [line]
-        for child in block.children():
-            rendered = ctx.render_block(child)
-            if not rendered.strip():
-                continue
-            sections.append(ctx.indent(rendered))
+        sections.extend(ctx.indent(rendered) for rendered in ctx.render_blocks(block.id, block.children()))
         return "\n".join(sections)
 
 
@@ -316,7 +298,7 @@ class DatasetColumn:
 def dataset_columns_from_schema(props: Any) -> list[DatasetColumn]:
     if props is None:
         return []
-    schema = getattr(props, "schema", None) or getattr(props, "data_schema", None)
+    schema = getattr(props, "data_schema", None)
     if not schema:
         return []
     return _normalise_dataset_schema(schema)
@@ -325,7 +307,7 @@ def dataset_columns_from_schema(props: Any) -> list[DatasetColumn]:
 def infer_dataset_columns(records: list[Block]) -> list[DatasetColumn]:
     ordered_keys: list[str] = []
     for record in records:
-        data = record.content.data if record.content and record.content.data else {}
+        data = _data_of(record)
         for key in data.keys():
             if key not in ordered_keys:
                 ordered_keys.append(key)
@@ -339,28 +321,26 @@ def render_dataset_table(columns: list[DatasetColumn], records: list[Block]) ->
     headers = [column.header for column in columns]
     header_line = format_table_row(headers, width)
     align_line = format_alignment_row(["left"] * width, width)
+    keys = [column.key for column in columns]
     body_lines: list[str] = []
     for record in records:
-        data = record.content.data if record.content and record.content.data else {}
-        row = [stringify_cell(data.get(column.key)) for column in columns]
-        body_lines.append(format_table_row(row, width))
+        data = _data_of(record)
+        body_lines.append(format_table_row([stringify_cell(data.get(key)) for key in keys], width))
     return "\n".join([header_line, align_line, *body_lines])
 
 
-def format_table_row(values: list[Any], width: int) -> str:
-    cells = ["" if value is None else str(value) for value in values]
+def format_table_row(values: Sequence[Any], width: int) -> str:
+    # Truncate before converting so surplus cells are never stringified.
+    cells = ["" if value is None else str(value) for value in values[:width]]
     if len(cells) < width:
         cells.extend([""] * (width - len(cells)))
-    elif len(cells) > width:
-        cells = cells[:width]
     return f"| {' | '.join(cells)} |"
 
 
-def format_alignment_row(alignments: list[Any], width: int) -> str:
-    markers = []
-    for index in range(width):
-        alignment = alignments[index] if index < len(alignments) else None
-        markers.append(_alignment_marker(alignment))
+def format_alignment_row(alignments: Sequence[Any], width: int) -> str:
+    markers = [_alignment_marker(alignment) for alignment in alignments[:width]]
+    if len(markers) < width:
+        markers.extend(["---"] * (width - len(markers)))
     return f"| {' | '.join(markers)} |"
 
 
@@ -407,27 +387,90 @@ def _normalise_dataset_schema(schema: Any) -> list[DatasetColumn]:
 # Misc helpers (kept local to this module)
 
 
+def _text_of(block: Block) -> str:
+    content = block.content
+    if content is None:
+        return ""
+    return content.plain_text or ""
+
+
+def _object_of(block: Block) -> dict[str, Any]:
+    content = block.content
+    if content is None:
+        return {}
+    return content.object or {}
+
+
+def _data_of(block: Block) -> dict[str, Any]:
+    content = block.content
+    if content is None:
+        return {}
+    return content.data or {}
+
+
 def _block_text(block: Block) -> str:
-    if block.content and block.content.plain_text:
-        return block.content.plain_text.strip()
-    return ""
+    return _text_of(block).strip()
 
 
-def _ordered_index(block: Block) -> int:
-    parent = block.parent()
-    if parent is None:
+def _ordered_index(block: Block, cache: dict[UUID, dict[UUID, int]] | None = None) -> int:
+    parent_id = block.parent_id
+    if parent_id is None:
         return 1
-    index = 0
-    for sibling in parent.children():
+    # Parents normally seed this while rendering their children; the lookup
+    # below only runs when a list item is rendered on its own.
+    ordinals = cache.get(parent_id) if cache is not None else None
+    if ordinals is None:
+        parent = block.parent()
+        if parent is None:
+            return 1
+        ordinals = _numbered_ordinals(parent.children())
+        if cache is not None:
+            cache[parent_id] = ordinals
+    return ordinals.get(block.id, 1)
+
+
+def _numbered_ordinals(siblings: Sequence[Block]) -> dict[UUID, int]:
+    ordinals: dict[UUID, int] = {}
+    for sibling in siblings:
         if sibling.type is BlockType.NUMBERED_LIST_ITEM:
-            index += 1
-        if sibling.id == block.id:
-            return index or 1
-    return 1
+            ordinals[sibling.id] = len(ordinals) + 1
+    return ordinals
+
+
+def join_sections(sections: Sequence[str]) -> str:
+    stripped = [section.strip() for section in sections if section]
+    cleaned = [section for section in stripped if section]
+    if not cleaned:
+        return ""
+
+    first = cleaned[0]
+    parts = [first]
+    last_line = _last_line(first)
+    for section in cleaned[1:]:
+        separator = "\n\n"
+        prev_kind = _section_kind(last_line)
+        next_kind = _section_kind(_first_line(section))
+        if prev_kind and prev_kind == next_kind and prev_kind in {"bullet", "numbered"}:
+            separator = "\n"
+        parts.append(separator)
+        parts.append(section)
+        last_line = _last_line(section)
+    return "".join(parts)
+
+
+def _first_line(text: str) -> str:
+    # Slice around the newline instead of split(), which would copy the rest.
+    newline = text.find("\n")
+    return text if newline < 0 else text[:newline]
+
+
+def _last_line(text: str) -> str:
+    newline = text.rfind("\n")
+    return text if newline < 0 else text[newline + 1 :]
 
 
 def _section_kind(line: str) -> str | None:
-    stripped = line.lstrip()
+    stripped = line.lstrip() if line[:1].isspace() else line
     if not stripped:
         return None
     if stripped[0] in "-*+" and (len(stripped) == 1 or stripped[1].isspace()):
@@ -438,15 +481,51 @@ def _section_kind(line: str) -> str | None:
     return None
 
 
+_ALIGNMENT_MARKERS = {
+    "left": ":---",
+    "center": ":---:",
+    "right": "---:",
+}
+
+
 def _alignment_marker(alignment: Any) -> str:
-    mapping = {
-        None: "---",
-        "left": ":---",
-        "center": ":---:",
-        "right": "---:",
-    }
-    key = str(alignment).lower() if alignment is not None else None
-    return mapping.get(key, "---")
+    if alignment is None:
+        return "---"
+    return _ALIGNMENT_MARKERS.get(str(alignment).lower(), "---")
+
+
+def _pretty_json(payload: dict[str, Any]) -> str:
+    if orjson is not None and _is_plain_json(payload):
+        try:
+            encoded = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:  # e.g. non-string keys
+            encoded = b""
+        # json escapes everything outside printable ASCII; orjson writes it raw.
+        if encoded and encoded.isascii() and b"\x7f" not in encoded:
+            return encoded.decode()
+    return json.dumps(payload, indent=2, sort_keys=True)
+
+
+def _is_plain_json(value: Any) -> bool:
+    """Whether orjson prints ``value`` exactly as ``json.dumps`` does.
+
+    Floats are excluded (orjson drops the ``+`` in exponents and writes NaN as
+    ``null``), as is anything json would reject or convert differently.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        elif kind is int:
+            if not -(1 << 63) <= item < (1 << 64):
+                return False
+        elif kind is not str and kind is not bool and item is not None:
+            return False
+    return True
 
 
 def _pretty_label(key: str) -> str:
@@ -519,8 +598,12 @@ def _attach_clone_resolvers(clones: dict[UUID, Block]) -> dict[UUID, Block]:
         return [resolved[block_id] for block_id in ids if block_id in resolved]
 
     for block_id, block in clones.items():
-        resolved_block = block.with_resolvers(resolve_one=resolve_one, resolve_many=resolve_many)
-        resolved[block_id] = resolved_block
+        # Clones are private to this projection, so bind without another copy.
+        resolved[block_id] = block.with_resolvers(
+            resolve_one=resolve_one,
+            resolve_many=resolve_many,
+            copy=False,
+        )
 
     return resolved
 
@@ -550,4 +633,5 @@ DEFAULT_COMPONENTS: dict[BlockType, RendererComponent] = {
 __all__ = [
     "DEFAULT_COMPONENTS",
     "GenericComponent",
+    "join_sections",
 ]
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence
+from functools import lru_cache
+from typing import Any, Callable, Mapping
 
 from block_data_store.models.block import Block, BlockType
 from block_data_store.renderers.base import RenderOptions, Renderer, RendererComponent
 
-from .components import DEFAULT_COMPONENTS, GenericComponent
+from .components import DEFAULT_COMPONENTS, _ORDINALS_KEY, GenericComponent, join_sections
 
 
 def _default_components() -> dict[BlockType, RendererComponent]:
@@ -19,15 +20,22 @@ def _default_components() -> dict[BlockType, RendererComponent]:
 class MarkdownRenderer(Renderer):
     _components: dict[BlockType, RendererComponent] = field(default_factory=dict)
     _fallback_component: RendererComponent | None = None
+    _dispatch: dict[BlockType, Callable[..., str]] = field(init=False, repr=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         if not self._components:
             self._components = _default_components()
         if self._fallback_component is None:
             self._fallback_component = GenericComponent()
+        # Every block type resolves to a bound ``render`` so dispatch is one lookup.
+        fallback = self._fallback_component.render
+        self._dispatch = {block_type: fallback for block_type in BlockType}
+        for block_type, component in self._components.items():
+            self._dispatch[block_type] = component.render
 
     def register(self, block_type: BlockType, component: RendererComponent) -> None:
         self._components[block_type] = component
+        self._dispatch[block_type] = component.render
 
     def render(
         self,
@@ -36,9 +44,10 @@ class MarkdownRenderer(Renderer):
         options: RenderOptions | None = None,
         **kwargs: Any,
     ) -> str:
-        opts = options or RenderOptions()
-        extra = dict(kwargs)
-        return self._render_block(block, opts, extra).strip()
+        opts = options or RenderOptions.DEFAULT
+        # ``**kwargs`` is already a fresh dict per call, so it serves as ``extra``.
+        kwargs.setdefault(_ORDINALS_KEY, {})
+        return self._render_block(block, opts, kwargs).strip()
 
     # Internal helpers -------------------------------------------------
     def _render_block(
@@ -47,43 +56,20 @@ class MarkdownRenderer(Renderer):
         options: RenderOptions,
         extra: Mapping[str, Any],
     ) -> str:
-        component = self._components.get(block.type, self._fallback_component)
-        assert component is not None, "Fallback component must be configured"
-        rendered = component.render(block, engine=self, options=options, extra=extra)
+        rendered = self._dispatch[block.type](block, engine=self, options=options, extra=extra)
 
         if options.include_metadata and block.metadata:
-            metadata_lines = "\n".join(f"> {k}: {v}" for k, v in sorted(block.metadata.items()))
-            rendered = _join_sections([rendered, metadata_lines])
+            metadata = block.metadata
+            metadata_lines = "\n".join([f"> {key}: {metadata[key]}" for key in _sorted_keys(tuple(metadata))])
+            rendered = join_sections([rendered, metadata_lines])
 
         return rendered
 
 
-def _join_sections(sections: Sequence[str]) -> str:
-    cleaned = [section.strip() for section in sections if section and section.strip()]
-    if not cleaned:
-        return ""
-
-    output = cleaned[0]
-    for section in cleaned[1:]:
-        separator = "\n\n"
-        prev_kind = _section_kind(output.splitlines()[-1])
-        next_kind = _section_kind(section.splitlines()[0])
-        if prev_kind and prev_kind == next_kind and prev_kind in {"bullet", "numbered"}:
-            separator = "\n"
-        output = f"{output}{separator}{section}"
-    return output
-
-
-def _section_kind(line: str) -> str | None:
-    stripped = line.lstrip()
-    if not stripped:
-        return None
-    if stripped[0] in "-*+" and (len(stripped) == 1 or stripped[1].isspace()):
-        return "bullet"
-    number_prefix = stripped.split(" ", 1)[0]
-    if number_prefix.endswith(".") and number_prefix[:-1].isdigit():
-        return "numbered"
-    return None
+@lru_cache(maxsize=1024)
+def _sorted_keys(keys: tuple[str, ...]) -> tuple[str, ...]:
+    # Blocks from the same source tend to share metadata keys, so the order is reused.
+    return tuple(sorted(keys))
 
 
 __all__ = ["MarkdownRenderer"]
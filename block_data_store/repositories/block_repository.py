@@ -4,15 +4,24 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Sequence
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.orm import Session, aliased, sessionmaker
+from sqlalchemy.orm import Query, Session, aliased, sessionmaker, undefer
 
 from block_data_store.db.schema import DbBlock
-from block_data_store.models.block import Block, BlockType, Content, block_class_for
+from block_data_store.models.block import (
+    Block,
+    BlockType,
+    Content,
+    block_class_for,
+    block_type_for,
+    properties_model_for,
+)
 from block_data_store.repositories.filters import (
     FilterExpression,
     ParentFilter,
@@ -58,7 +67,7 @@ class BlockRepository:
             raise ValueError("Depth must be a non-negative integer or None.")
 
         with self._session_factory() as session:
-            query = session.query(DbBlock).filter(DbBlock.id == str(block_id))
+            query = self._block_query(session).filter(DbBlock.id == str(block_id))
             if not include_trashed:
                 query = query.filter(DbBlock.in_trash.is_(False))
             db_row = query.one_or_none()
@@ -66,7 +75,8 @@ class BlockRepository:
                 return None
 
             if depth == 0:
-                return self._with_resolvers(self._to_model(db_row))
+                block = self._to_model(db_row)
+                return self._wire_cache({block.id: block})[block.id]
 
             if depth is None:
                 return self._hydrate_full_root(session, db_row, include_trashed)
@@ -94,7 +104,7 @@ class BlockRepository:
     ) -> list[Block]:
         """Return blocks matching structural and semantic filters."""
         with self._session_factory() as session:
-            query = session.query(DbBlock)
+            query = self._block_query(session)
 
             query = self._apply_related_filters(query, relation="root", filter_spec=root)
             query = self._apply_related_filters(query, relation="parent", filter_spec=parent)
@@ -108,7 +118,9 @@ class BlockRepository:
 
             rows = query.all()
 
-        return [self._with_resolvers(self._to_model(row)) for row in rows]
+        blocks = [self._to_model(row) for row in rows]
+        wired_cache = self._wire_cache({block.id: block for block in blocks})
+        return [wired_cache[block.id] for block in blocks]
 
     def upsert_blocks(
         self,
@@ -313,39 +325,57 @@ class BlockRepository:
 
             session.commit()
 
-    def _resolve_one(self, block_id: UUID | None) -> Block | None:
-        if block_id is None:
-            return None
-        return self.get_block(block_id)
+    def _fetch_blocks(self, block_ids: Sequence[UUID]) -> list[Block]:
+        """Load visible blocks for ``block_ids`` in one query, preserving the given order."""
+        id_list = [str(block_id) for block_id in block_ids]
+        with self._session_factory() as session:
+            rows_by_id = self._load_rows(session, id_list, include_trashed=False)
+        return [self._to_model(rows_by_id[block_id]) for block_id in id_list if block_id in rows_by_id]
+
+    @staticmethod
+    def _block_query(session: Session) -> Query[DbBlock]:
+        """Query full rows, including the deferred ``content`` column, for hydration."""
+        return session.query(DbBlock).options(undefer(DbBlock.content))
 
-    def _resolve_many(self, block_ids: Iterable[UUID]) -> list[Block]:
-        resolved: list[Block] = []
-        for block_id in block_ids:
-            block = self._resolve_one(block_id)
-            if block is not None:
-                resolved.append(block)
-        return resolved
+    @staticmethod
+    def _load_rows(
+        session: Session,
+        block_ids: Sequence[str],
+        *,
+        include_trashed: bool,
+    ) -> dict[str, DbBlock]:
+        """Fetch rows for ``block_ids`` in a single ``IN`` query keyed by id."""
+        query = BlockRepository._block_query(session).filter(DbBlock.id.in_(block_ids))
+        if not include_trashed:
+            query = query.filter(DbBlock.in_trash.is_(False))
+        return {row.id: row for row in query.all()}
 
     @staticmethod
     def _to_model(record: DbBlock) -> Block:
+        """Rehydrate a stored row, skipping validation for data the store already vetted.
+
+        Only the typed properties are validated, since stored group ids must come back
+        as UUIDs.
+        """
         children_raw = record.children_ids or []
-        block_type = BlockType(record.type)
+        block_type = block_type_for(record.type)
         block_cls = block_class_for(block_type)
-        content = Content(**record.content) if record.content else None
-        return block_cls(
+        properties = properties_model_for(block_type).model_validate(record.properties or {})
+        content = Content.model_construct(**record.content) if record.content else None
+        return block_cls.model_construct(
             id=UUID(record.id),
             type=block_type,
-            parent_id=UUID(record.parent_id) if record.parent_id else None,
-            root_id=UUID(record.root_id),
-            children_ids=tuple(UUID(child_id) for child_id in children_raw),
-            workspace_id=UUID(record.workspace_id) if record.workspace_id else None,
+            parent_id=_shared_uuid(record.parent_id) if record.parent_id else None,
+            root_id=_shared_uuid(record.root_id),
+            children_ids=tuple(map(UUID, children_raw)),
+            workspace_id=_shared_uuid(record.workspace_id) if record.workspace_id else None,
             in_trash=record.in_trash,
             version=record.version,
             created_time=record.created_time,
             last_edited_time=record.last_edited_time,
-            created_by=UUID(record.created_by) if record.created_by else None,
-            last_edited_by=UUID(record.last_edited_by) if record.last_edited_by else None,
-            properties=record.properties or {},
+            created_by=_shared_uuid(record.created_by) if record.created_by else None,
+            last_edited_by=_shared_uuid(record.last_edited_by) if record.last_edited_by else None,
+            properties=properties,
             metadata=record.metadata_json or {},
             content=content,
             properties_version=record.properties_version,
@@ -384,18 +414,20 @@ class BlockRepository:
     @staticmethod
     def _collect_ancestor_ids(session: Session, block_row: DbBlock) -> set[str]:
         """Return the set of ancestor block ids (including the immediate parent)."""
-        ancestors: set[str] = set()
-        current_parent_id = block_row.parent_id
-        while current_parent_id:
-            if current_parent_id in ancestors:
-                # Defensive: break potential existing cycles.
-                break
-            ancestors.add(current_parent_id)
-            parent_row = session.get(DbBlock, current_parent_id)
-            if parent_row is None:
-                break
-            current_parent_id = parent_row.parent_id
-        return ancestors
+        if not block_row.parent_id:
+            return set()
+
+        # UNION (not UNION ALL) stops the walk on pre-existing cycles.
+        ancestors = (
+            select(DbBlock.id, DbBlock.parent_id)
+            .where(DbBlock.id == block_row.parent_id)
+            .cte("ancestors", recursive=True)
+        )
+        parent = aliased(DbBlock)
+        ancestors = ancestors.union(
+            select(parent.id, parent.parent_id).where(parent.id == ancestors.c.parent_id)
+        )
+        return set(session.scalars(select(ancestors.c.id)))
 
     def _move_within_session(
         self,
@@ -460,45 +492,34 @@ class BlockRepository:
         *,
         include_trashed: bool,
     ) -> None:
-        """Populate cache with blocks up to the requested depth."""
+        """Populate cache with blocks up to the requested depth (one query per level)."""
         if root_row.in_trash and not include_trashed:
             return
 
-        block = self._to_model(root_row)
-        cache[block.id] = block
-
-        if depth is not None and depth == 0:
-            return
-
-        next_depth = None if depth is None else depth - 1
-
-        children_ids: list[str] = list(root_row.children_ids or [])
-        if not children_ids:
-            return
+        level = [root_row]
+        remaining = depth
+        while level:
+            pending_ids: list[str] = []
+            for row in level:
+                block = self._to_model(row)
+                cache[block.id] = block
+                pending_ids.extend(row.children_ids or [])
+
+            if remaining is not None:
+                if remaining == 0:
+                    return
+                remaining -= 1
+
+            pending_ids = [
+                child_id
+                for child_id in dict.fromkeys(pending_ids)
+                if UUID(child_id) not in cache
+            ]
+            if not pending_ids:
+                return
 
-        child_rows = (
-            session.query(DbBlock)
-            .filter(DbBlock.id.in_(children_ids))
-            .all()
-        )
-        row_by_id = {row.id: row for row in child_rows}
-
-        for child_id in children_ids:
-            child_row = row_by_id.get(child_id)
-            if child_row is None:
-                continue
-            if child_row.in_trash and not include_trashed:
-                continue
-            child_uuid = UUID(child_row.id)
-            if child_uuid in cache:
-                continue
-            self._hydrate_subgraph(
-                session,
-                child_row,
-                next_depth,
-                cache,
-                include_trashed=include_trashed,
-            )
+            rows_by_id = self._load_rows(session, pending_ids, include_trashed=include_trashed)
+            level = [rows_by_id[child_id] for child_id in pending_ids if child_id in rows_by_id]
 
     def _hydrate_full_root(
         self,
@@ -506,7 +527,7 @@ class BlockRepository:
         root_row: DbBlock,
         include_trashed: bool,
     ) -> Block | None:
-        query = session.query(DbBlock).filter(DbBlock.root_id == root_row.root_id)
+        query = self._block_query(session).filter(DbBlock.root_id == root_row.root_id)
         if not include_trashed:
             query = query.filter(DbBlock.in_trash.is_(False))
         rows = query.all()
@@ -518,11 +539,35 @@ class BlockRepository:
         return wired_cache.get(UUID(root_row.id))
 
     def _wire_cache(self, cache: dict[UUID, Block]) -> dict[UUID, Block]:
-        """Attach shared resolvers to a cached block subgraph."""
+        """Attach shared resolvers to a cached block subgraph.
+
+        Blocks outside the prefetched subgraph are loaded on demand (one query per
+        ``children()`` call) and memoized in the same scope, so a traversal
+        materializes each block once. Blocks are snapshots of the read that produced
+        them; re-fetch to observe later writes.
+        """
         if not cache:
             return {}
 
         wired_cache: dict[UUID, Block] = {}
+        absent: set[UUID] = set()
+
+        def resolve_many(block_ids: Iterable[UUID]) -> list[Block]:
+            block_ids = tuple(block_ids)
+            missing = [
+                block_id
+                for block_id in block_ids
+                if block_id not in wired_cache and block_id not in absent
+            ]
+            if missing:
+                for block in self._fetch_blocks(missing):
+                    wired_cache[block.id] = block.with_resolvers(
+                        resolve_one=resolve_one,
+                        resolve_many=resolve_many,
+                        copy=False,
+                    )
+                absent.update(block_id for block_id in missing if block_id not in wired_cache)
+            return [wired_cache[block_id] for block_id in block_ids if block_id in wired_cache]
 
         def resolve_one(block_id: UUID | None) -> Block | None:
             if block_id is None:
@@ -530,23 +575,14 @@ class BlockRepository:
             block = wired_cache.get(block_id)
             if block is not None:
                 return block
-            return self.get_block(block_id, depth=0)
-
-        def resolve_many(block_ids: Iterable[UUID]) -> list[Block]:
-            resolved: list[Block] = []
-            for block_id in block_ids:
-                block = resolve_one(block_id)
-                if block is not None:
-                    resolved.append(block)
-            return resolved
+            resolved = resolve_many((block_id,))
+            return resolved[0] if resolved else None
 
-        for block in cache.values():
-            wired_cache[block.id] = block
-
-        for block_id, block in list(wired_cache.items()):
+        for block_id, block in cache.items():
             wired_cache[block_id] = block.with_resolvers(
                 resolve_one=resolve_one,
                 resolve_many=resolve_many,
+                copy=False,
             )
 
         return wired_cache
@@ -567,23 +603,20 @@ class BlockRepository:
         session.commit()
 
     def _collect_descendant_ids(self, session: Session, root_ids: Iterable[str]) -> set[str]:
-        """Return every descendant id reachable from ``root_ids`` (including the roots)."""
-        pending = list(root_ids)
+        """Return every descendant id reachable from ``root_ids`` (including the roots).
+
+        Follows ``children_ids`` one tree level per query rather than one row at a time.
+        """
         seen: set[str] = set()
+        pending = set(root_ids)
 
         while pending:
-            current_id = pending.pop()
-            if current_id in seen:
-                continue
-            seen.add(current_id)
-            row = session.get(DbBlock, current_id)
-            if row is None:
-                continue
-            pending.extend(row.children_ids or [])
+            seen.update(pending)
+            rows = session.execute(select(DbBlock.children_ids).where(DbBlock.id.in_(pending)))
+            pending = {child_id for (children,) in rows for child_id in children or ()} - seen
 
         return seen
 
-
     def _apply_filters(
         self,
         query,
@@ -617,13 +650,6 @@ class BlockRepository:
             property_filter=getattr(filter_spec, "property_filter", None),
         )
 
-    def _with_resolvers(self, block: Block) -> Block:
-        """Attach navigation resolvers to a block instance."""
-        return block.with_resolvers(
-            resolve_one=lambda _id: self._resolve_one(_id),
-            resolve_many=lambda ids: self._resolve_many(ids),
-        )
-
 __all__ = [
     "BlockRepository",
     "BlockNotFoundError",
@@ -633,6 +659,12 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def _shared_uuid(value: str) -> UUID:
+    """Parse ids that repeat across rows (root, parent, workspace, authors) once."""
+    return UUID(value)
+
+
 def _jsonable(value):
     if value is None:
         return None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Callable, Iterable, Sequence
 from uuid import UUID
 
@@ -133,24 +134,28 @@ def apply_structural_filters(query, model, where: WhereClause):
     return query
 
 
-def _resolve_json_filter_target(model, path: str) -> tuple[Any, list[str]]:
+_JSON_COLUMNS: dict[str, str] = {
+    "properties": "properties",
+    "content": "content",
+    "metadata": "metadata_json",
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_filter_path(path: str) -> tuple[str, tuple[str, ...]]:
+    """Split a dotted filter path into its column name and JSON segments (cached per path)."""
     segments = [segment for segment in path.split(".") if segment]
     if not segments:
         raise ValueError("JSON path cannot be empty.")
 
-    column_map: dict[str, str] = {
-        "properties": "properties",
-        "content": "content",
-        "metadata": "metadata_json",
-    }
-
-    first_segment = segments[0]
-    if first_segment in column_map:
-        column_name = column_map[first_segment]
-        json_segments = segments[1:]
-    else:
-        column_name = "properties"
-        json_segments = segments
+    column_name = _JSON_COLUMNS.get(segments[0])
+    if column_name is None:
+        return "properties", tuple(segments)
+    return column_name, tuple(segments[1:])
+
+
+def _resolve_json_filter_target(model, path: str) -> tuple[Any, tuple[str, ...]]:
+    column_name, json_segments = _parse_filter_path(path)
 
     try:
         column = getattr(model, column_name)
@@ -124,7 +124,7 @@ def measure_sample(
         fetch_times.append((time.perf_counter() - fetch_start) * 1000)
 
         render_start = time.perf_counter()
-        rendered_doc = renderer.render(document_block, options=RenderOptions())
+        rendered_doc = renderer.render(document_block, options=RenderOptions.DEFAULT)
         render_times.append((time.perf_counter() - render_start) * 1000)
         render_lengths.append(len(rendered_doc))
 
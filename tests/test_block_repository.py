@@ -3,7 +3,10 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
 
+from block_data_store.db.schema import DbBlock
 from block_data_store.models.block import BlockType, Content
 from block_data_store.repositories.block_repository import (
     BlockNotFoundError,
@@ -107,6 +110,198 @@ def test_get_block_with_depth_prefetches_children_and_reuses_instances(repositor
     assert paragraph.content.plain_text == "Paragraph body"
 
 
+def test_children_resolve_in_single_query_preserving_order(repository, block_factory, engine):
+    document_id = uuid4()
+    child_ids = [uuid4() for _ in range(5)]
+    trashed_id = child_ids[2]
+
+    repository.upsert_blocks(
+        [
+            block_factory(
+                block_id=document_id,
+                block_type=BlockType.DOCUMENT,
+                parent_id=None,
+                root_id=document_id,
+                children_ids=tuple(reversed(child_ids)),
+            ),
+            *[
+                block_factory(
+                    block_id=child_id,
+                    block_type=BlockType.PARAGRAPH,
+                    parent_id=document_id,
+                    root_id=document_id,
+                )
+                for child_id in child_ids
+            ],
+        ]
+    )
+    repository.set_in_trash([trashed_id], in_trash=True)
+
+    document = repository.get_block(document_id)
+    assert document is not None
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        children = document.children()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [child.id for child in children] == [
+        child_id for child_id in reversed(child_ids) if child_id != trashed_id
+    ]
+    assert len(statements) == 1
+
+
+def test_rehydrated_blocks_match_stored_models(repository, block_factory):
+    document_id = uuid4()
+    group_id = uuid4()
+    paragraph_id = uuid4()
+
+    paragraph = block_factory(
+        block_id=paragraph_id,
+        block_type=BlockType.PARAGRAPH,
+        parent_id=document_id,
+        root_id=document_id,
+        content=Content(plain_text="Body", data={"score": 3}),
+        properties={"groups": [group_id]},
+        metadata={"source": "test"},
+    )
+    repository.upsert_blocks(
+        [
+            block_factory(
+                block_id=document_id,
+                block_type=BlockType.DOCUMENT,
+                parent_id=None,
+                root_id=document_id,
+                children_ids=(paragraph_id,),
+            ),
+            paragraph,
+        ]
+    )
+
+    fetched = repository.get_block(paragraph_id)
+    assert fetched is not None
+    assert type(fetched) is type(paragraph)
+    assert fetched.properties.groups == [group_id]
+    assert fetched.content == paragraph.content
+    assert fetched.metadata == {"source": "test"}
+    assert fetched.parent().id == document_id
+
+
+def test_content_is_deferred_for_structural_reads(repository, block_factory, session_factory):
+    document_id = uuid4()
+    repository.upsert_blocks(
+        [
+            block_factory(
+                block_id=document_id,
+                block_type=BlockType.DOCUMENT,
+                parent_id=None,
+                root_id=document_id,
+                content=Content(plain_text="Large body"),
+            )
+        ]
+    )
+
+    with session_factory() as session:
+        row = session.get(DbBlock, str(document_id))
+        assert "content" in sa_inspect(row).unloaded
+
+    fetched = repository.get_block(document_id)
+    assert fetched is not None
+    assert fetched.content.plain_text == "Large body"
+
+
+def test_lazy_navigation_memoizes_blocks_within_a_read(repository, block_factory):
+    document_id = uuid4()
+    heading_id = uuid4()
+
+    repository.upsert_blocks(
+        [
+            block_factory(
+                block_id=document_id,
+                block_type=BlockType.DOCUMENT,
+                parent_id=None,
+                root_id=document_id,
+                children_ids=(heading_id,),
+            ),
+            block_factory(
+                block_id=heading_id,
+                block_type=BlockType.HEADING,
+                parent_id=document_id,
+                root_id=document_id,
+            ),
+        ]
+    )
+
+    document = repository.get_block(document_id)
+    assert document is not None
+
+    heading = document.children()[0]
+    assert document.children()[0] is heading
+    assert heading.parent() is document
+
+
+def test_descendants_bfs_resolves_one_level_per_query(repository, block_factory, engine):
+    document_id = uuid4()
+    heading_ids = [uuid4(), uuid4()]
+    paragraph_ids = {heading_id: [uuid4(), uuid4()] for heading_id in heading_ids}
+
+    blocks = [
+        block_factory(
+            block_id=document_id,
+            block_type=BlockType.DOCUMENT,
+            parent_id=None,
+            root_id=document_id,
+            children_ids=tuple(heading_ids),
+        )
+    ]
+    for heading_id in heading_ids:
+        blocks.append(
+            block_factory(
+                block_id=heading_id,
+                block_type=BlockType.HEADING,
+                parent_id=document_id,
+                root_id=document_id,
+                children_ids=tuple(paragraph_ids[heading_id]),
+            )
+        )
+        blocks.extend(
+            block_factory(
+                block_id=paragraph_id,
+                block_type=BlockType.PARAGRAPH,
+                parent_id=heading_id,
+                root_id=document_id,
+            )
+            for paragraph_id in paragraph_ids[heading_id]
+        )
+    repository.upsert_blocks(blocks)
+
+    document = repository.get_block(document_id)
+    assert document is not None
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        descendants = list(document.descendants_bfs())
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    expected_paragraphs = [pid for heading_id in heading_ids for pid in paragraph_ids[heading_id]]
+    assert [block.id for block in descendants] == heading_ids + expected_paragraphs
+    assert len(statements) == 2
+    assert [block.id for block in document.descendants_bfs(max_depth=1)] == heading_ids
+
+
 def test_get_block_depth_none_materialises_full_tree(repository, block_factory):
     document_id = uuid4()
     heading_id = uuid4()
@@ -662,6 +857,51 @@ def test_in_trash_flag_controls_visibility(repository, block_factory):
     assert restored_paragraph.parent_id == heading_id
 
 
+def test_trash_cascade_follows_children_ids(repository, block_factory):
+    document_id = uuid4()
+    heading_id = uuid4()
+    listed_id = uuid4()
+    stray_id = uuid4()
+
+    repository.upsert_blocks(
+        [
+            block_factory(
+                block_id=document_id,
+                block_type=BlockType.DOCUMENT,
+                parent_id=None,
+                root_id=document_id,
+                children_ids=(heading_id,),
+            ),
+            block_factory(
+                block_id=heading_id,
+                block_type=BlockType.HEADING,
+                parent_id=document_id,
+                root_id=document_id,
+                children_ids=(listed_id,),
+            ),
+            block_factory(
+                block_id=listed_id,
+                block_type=BlockType.PARAGRAPH,
+                parent_id=document_id,  # disagrees with the heading's children_ids
+                root_id=document_id,
+            ),
+            block_factory(
+                block_id=stray_id,
+                block_type=BlockType.PARAGRAPH,
+                parent_id=heading_id,  # points at the heading but is not listed there
+                root_id=document_id,
+            ),
+        ]
+    )
+
+    repository.set_in_trash([heading_id], in_trash=True, cascade=True)
+
+    listed = repository.get_block(listed_id, include_trashed=True)
+    stray = repository.get_block(stray_id, include_trashed=True)
+    assert listed is not None and listed.in_trash
+    assert stray is not None and not stray.in_trash
+
+
 def test_query_blocks_supports_nested_json_paths_and_operators(repository, block_factory):
     document_id = uuid4()
     dataset_id = uuid4()
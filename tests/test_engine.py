@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import math
+import threading
 from pathlib import Path
 
 import pytest
+from sqlalchemy import JSON, column, insert, inspect, select, table, text
 
 from block_data_store.db.engine import create_engine
+from block_data_store.db.schema import Base, create_all
 
 
 def test_create_engine_supports_sqlite_path(tmp_path: Path) -> None:
@@ -21,3 +25,80 @@ def test_create_engine_rejects_conflicting_configuration(tmp_path: Path) -> None
 
     with pytest.raises(ValueError):
         create_engine(connection_string="sqlite:///ignored.db", sqlite_path=db_path)
+
+
+def test_create_engine_round_trips_json_columns(tmp_path: Path) -> None:
+    engine = create_engine(sqlite_path=tmp_path / "blocks.db")
+    payload = {"title": "Café", "tags": ["a", "b"], "nested": {"count": 3, "ratio": 0.5, "flag": None}}
+
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE docs (body JSON)"))
+        connection.execute(
+            insert(table("docs", column("body", JSON))).values(body=payload)
+        )
+
+    with engine.connect() as connection:
+        stored = connection.execute(select(column("body", JSON)).select_from(table("docs"))).scalar_one()
+
+    assert stored == payload
+
+
+def test_in_memory_engine_shares_database_across_threads() -> None:
+    engine = create_engine()
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE marker (value INTEGER)"))
+        connection.execute(text("INSERT INTO marker VALUES (7)"))
+
+    result: list[int] = []
+
+    def read_marker() -> None:
+        with engine.connect() as connection:
+            result.append(connection.execute(text("SELECT value FROM marker")).scalar_one())
+
+    worker = threading.Thread(target=read_marker)
+    worker.start()
+    worker.join()
+
+    assert result == [7]
+
+
+def test_create_all_skips_schema_work_once_stamped(tmp_path: Path, monkeypatch) -> None:
+    engine = create_engine(sqlite_path=tmp_path / "blocks.db")
+    create_all(engine)
+    assert inspect(engine).has_table("blocks")
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("schema already stamped; create_all should be skipped")
+
+    monkeypatch.setattr(Base.metadata, "create_all", fail)
+    create_all(engine)
+
+
+def test_create_all_recreates_dropped_tables_despite_stamp(tmp_path: Path) -> None:
+    engine = create_engine(sqlite_path=tmp_path / "blocks.db")
+    create_all(engine)
+
+    Base.metadata.tables["relationships"].drop(engine)
+    Base.metadata.tables["blocks"].drop(engine)
+    assert not inspect(engine).has_table("blocks")
+
+    create_all(engine)
+
+    assert inspect(engine).has_table("blocks")
+    assert inspect(engine).has_table("relationships")
+
+
+def test_json_columns_fall_back_to_stdlib_for_values_orjson_rejects(tmp_path: Path) -> None:
+    engine = create_engine(sqlite_path=tmp_path / "blocks.db")
+    payloads = table("payloads", column("id"), column("body", JSON))
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE payloads (id INTEGER PRIMARY KEY, body JSON)"))
+        connection.execute(insert(payloads).values(id=1, body={"big": 2**70}))
+        connection.execute(insert(payloads).values(id=2, body={"ratio": float("nan"), "note": None}))
+        raw = connection.execute(text("SELECT body FROM payloads WHERE id = 2")).scalar()
+        rows = dict(connection.execute(select(payloads.c.id, payloads.c.body)).all())
+
+    assert "NaN" in raw
+    assert rows[1] == {"big": 2**70}
+    assert math.isnan(rows[2]["ratio"])
+    assert rows[2]["note"] is None
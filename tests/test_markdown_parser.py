@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from block_data_store.models.block import BlockType
-from block_data_store.parser import markdown_to_blocks
+from block_data_store.models.block import BlockType, block_class_for
+from block_data_store.parser import load_markdown_path, load_markdown_paths, markdown_to_blocks
+from block_data_store.parser._uuids import UUIDBatch
 
 
 def test_markdown_parser_emits_core_blocks():
@@ -62,3 +63,60 @@ print("hi")
 
     html_block = next(block for block in blocks if block.type is BlockType.HTML)
     assert html_block.content and html_block.content.plain_text.startswith("<div data-role=\"note\">")
+
+
+def test_markdown_parser_blocks_match_validated_models():
+    source = """# Title
+
+## Section
+
+Text with *emphasis* and `code`.
+
+1. First
+2. Second
+
+```sql
+select 1
+```
+
+| A | B |
+|:--|--:|
+| 1 | 2 |
+"""
+
+    for block in markdown_to_blocks(source):
+        validated = block_class_for(block.type).model_validate(block.model_dump())
+        assert validated == block
+        assert type(validated.properties) is type(block.properties)
+
+
+def test_uuid_batch_refills_with_distinct_version_4_ids():
+    batch = UUIDBatch(size=4)
+
+    ids = [batch.next() for _ in range(10)]
+
+    assert len(set(ids)) == 10
+    assert all(value.version == 4 for value in ids)
+
+
+def test_load_markdown_path_normalises_line_endings(tmp_path):
+    path = tmp_path / "windows.md"
+    path.write_bytes(b"# Title\r\n\r\n```\r\nline one\rline two\r\n```\r\n")
+
+    blocks = load_markdown_path(path)
+
+    code_block = next(block for block in blocks if block.type is BlockType.CODE)
+    assert code_block.content.plain_text == "line one\nline two"
+
+
+def test_load_markdown_paths_preserves_order_with_distinct_documents(tmp_path):
+    paths = []
+    for number in range(3):
+        path = tmp_path / f"doc_{number}.md"
+        path.write_text(f"# Doc {number}\n\nBody {number}.\n", encoding="utf-8")
+        paths.append(path)
+
+    results = list(load_markdown_paths(paths, max_workers=2))
+
+    assert [blocks[0].properties.title for blocks in results] == ["Doc 0", "Doc 1", "Doc 2"]
+    assert len({blocks[0].id for blocks in results}) == 3
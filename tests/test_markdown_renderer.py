@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import json
 from uuid import UUID, uuid4
 
 import pytest
 
 from block_data_store.models.block import BlockType, Content
 from block_data_store.renderers import MarkdownRenderer, RenderOptions
+from block_data_store.renderers.markdown.components import join_sections
 
 
 def _wire(blocks):
@@ -131,6 +133,39 @@ def test_dataset_renderer_converts_records_to_table(block_factory):
     assert output == expected
 
 
+def test_dataset_renderer_uses_schema_headers_and_order(block_factory):
+    dataset_id = uuid4()
+    record_id = uuid4()
+
+    dataset = block_factory(
+        block_id=dataset_id,
+        block_type=BlockType.DATASET,
+        parent_id=None,
+        root_id=dataset_id,
+        children_ids=(record_id,),
+        properties={
+            "data_schema": {
+                "columns": [
+                    {"key": "status", "title": "State"},
+                    {"key": "title", "title": "Item Name"},
+                ]
+            },
+        },
+    )
+    record = block_factory(
+        block_id=record_id,
+        block_type=BlockType.RECORD,
+        parent_id=dataset_id,
+        root_id=dataset_id,
+        content=Content(data={"title": "Item A", "status": "Active"}),
+    )
+
+    blocks = _wire([dataset, record])
+    output = MarkdownRenderer().render(blocks[dataset_id])
+
+    assert output == "| State | Item Name |\n| :--- | :--- |\n| Active | Item A |"
+
+
 def test_markdown_renderer_renders_lists(block_factory):
     doc_id = uuid4()
     heading_id = uuid4()
@@ -280,6 +315,13 @@ def test_markdown_renderer_renders_lists(block_factory):
     assert output == expected
 
 
+def test_join_sections_keeps_list_runs_tight():
+    sections = ["Intro", "* a\n    * nested", "* b", "  ", "1. one", "2. two", "Outro"]
+
+    assert join_sections(sections) == "Intro\n\n* a\n    * nested\n* b\n\n1. one\n2. two\n\nOutro"
+    assert join_sections(["", "   "]) == ""
+
+
 def test_markdown_renderer_renders_quote_block(block_factory):
     quote_id = uuid4()
     paragraph_id = uuid4()
@@ -373,6 +415,29 @@ def test_object_renderer_renders_summary_and_json(block_factory):
     assert '"status": "Open"' in output
 
 
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"b": [1, True, None], "a": {"name": "Plain", "ok": False}},
+        {"ratio": float("nan"), "limit": float("inf"), "big": 1e21},
+        {"name": "Café", "tag": "\x7f"},
+        {"big": 2**70, "nested": [{"z": 1, "a": 2}]},
+    ],
+)
+def test_object_renderer_pretty_prints_json_like_stdlib(block_factory, payload):
+    obj = block_factory(
+        block_type=BlockType.OBJECT,
+        parent_id=None,
+        root_id=uuid4(),
+        content=Content(object=payload),
+    )
+
+    output = MarkdownRenderer().render(obj)
+
+    expected = json.dumps(payload, indent=2, sort_keys=True)
+    assert output == f"```json\n{expected}\n```"
+
+
 @pytest.mark.parametrize(
     ("block_type", "properties"),
     [
@@ -460,3 +525,24 @@ def test_page_group_renderer_respects_tagged_blocks(block_factory):
     assert output.count("Tagged Heading") == 1
     assert "Tagged paragraph." in output
     assert "Untagged content." not in output
+
+
+def test_markdown_renderer_register_overrides_dispatch(block_factory):
+    class ShoutComponent:
+        def render(self, block, *, engine, options, extra):
+            return block.content.plain_text.upper()
+
+    paragraph_id = uuid4()
+    paragraph = block_factory(
+        block_id=paragraph_id,
+        block_type=BlockType.PARAGRAPH,
+        parent_id=None,
+        root_id=paragraph_id,
+        content=Content(plain_text="quiet"),
+    )
+    renderer = MarkdownRenderer()
+    assert renderer.render(paragraph) == "quiet"
+
+    renderer.register(BlockType.PARAGRAPH, ShoutComponent())
+
+    assert renderer.render(paragraph) == "QUIET"
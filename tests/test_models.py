@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+import pickle
+
+from pydantic import TypeAdapter
+
+from block_data_store.models.block import AnyBlock, BlockType, HeadingBlock, blocks_from_json_bytes
+from block_data_store.parser import markdown_to_blocks
+
+
+def test_any_block_dispatches_on_type_tag() -> None:
+    blocks = markdown_to_blocks("# Title\n\nBody text\n\n* item\n\n```python\nprint(1)\n```\n")
+    adapter = TypeAdapter(AnyBlock)
+
+    for block in blocks:
+        restored = adapter.validate_python(block.model_dump(mode="json"))
+        assert type(restored) is type(block)
+        assert restored == block
+        assert isinstance(restored.type, BlockType)
+
+
+def test_blocks_from_json_bytes_restores_typed_blocks() -> None:
+    blocks = markdown_to_blocks("# Title\n\n## Section\n\nBody text\n")
+    payload = json.dumps([block.model_dump(mode="json") for block in blocks]).encode()
+
+    restored = blocks_from_json_bytes(payload)
+
+    assert [type(block) for block in restored] == [type(block) for block in blocks]
+    assert restored == blocks
+
+    heading = next(block for block in blocks if block.type is BlockType.HEADING)
+    assert HeadingBlock.from_json_bytes(heading.model_dump_json()) == heading
+
+
+def test_unwired_blocks_pickle_and_bind_resolvers_in_place() -> None:
+    blocks = markdown_to_blocks("# Title\n\nBody text\n")
+    assert pickle.loads(pickle.dumps(blocks)) == blocks
+
+    document = blocks[0]
+    by_id = {block.id: block for block in blocks}
+    bound = document.with_resolvers(
+        resolve_many=lambda ids: [by_id[block_id] for block_id in ids],
+        copy=False,
+    )
+
+    assert bound is document
+    assert [child.id for child in document.children()] == list(document.children_ids)
@@ -4,14 +4,22 @@ import json
 import os
 import re
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Iterable
-from uuid import UUID
+from uuid import RFC_4122, UUID
 
 import pytest
 
 from block_data_store.models.block import Block, BlockType
 from block_data_store.parser import markdown_to_blocks
-from block_data_store.parser.azure_di_parser import azure_di_to_blocks
+from block_data_store.parser import azure_di_parser
+from block_data_store.parser._uuids import bulk_uuid4
+from block_data_store.parser.azure_di_parser import (
+    AzureDiConfig,
+    _result_payload,
+    analyze_with_cache,
+    azure_di_to_blocks,
+)
 from block_data_store.renderers import MarkdownRenderer
 
 
@@ -101,6 +109,165 @@ def test_page_first_assigns_page_tags(monkeypatch: pytest.MonkeyPatch, azure_di_
         assert groups, f"Content block {block.id} missing page tags in page-first mode"
 
 
+def test_analyze_with_cache_reuses_cached_payload(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    azure_di_payload: dict,
+) -> None:
+    calls: list[bytes] = []
+
+    def _fake_request(data: bytes, config, client):  # type: ignore[override]
+        calls.append(bytes(data))
+        return azure_di_payload
+
+    monkeypatch.setattr("block_data_store.parser.azure_di_parser._run_analyze_request", _fake_request)
+    config = AzureDiConfig(cache_dir=tmp_path)
+
+    first = analyze_with_cache(b"%PDF-1.7 sample", config=config)
+    second = analyze_with_cache(b"%PDF-1.7 sample", config=config)
+
+    assert calls == [b"%PDF-1.7 sample"]
+    assert first == azure_di_payload
+    assert second == azure_di_payload
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_analyze_with_cache_serves_repeat_calls_from_memory(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    payload = {"content": "cached", "pages": []}
+    monkeypatch.setattr(
+        "block_data_store.parser.azure_di_parser._run_analyze_request",
+        lambda data, config, client: payload,
+    )
+    config = AzureDiConfig(cache_dir=tmp_path)
+
+    first = analyze_with_cache(b"memory", config=config)
+    for cached_file in tmp_path.glob("*.json"):
+        cached_file.unlink()
+    second = analyze_with_cache(b"memory", config=config)
+
+    assert second is first
+
+
+def test_analyze_with_cache_hashes_path_and_stream_sources(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    calls: list[bytes] = []
+
+    def _fake_request(data: bytes, config, client):  # type: ignore[override]
+        calls.append(bytes(data))
+        return {"content": "", "pages": []}
+
+    monkeypatch.setattr("block_data_store.parser.azure_di_parser._run_analyze_request", _fake_request)
+    config = AzureDiConfig(cache_dir=tmp_path / "cache")
+    source = tmp_path / "sample.pdf"
+    source.write_bytes(b"%PDF" + bytes(range(256)) * 8192)
+
+    analyze_with_cache(source, config=config)
+    analyze_with_cache(str(source), config=config)
+    with source.open("rb") as stream:
+        analyze_with_cache(stream, config=config)
+    with source.open("rb") as stream:
+        analyze_with_cache(stream, config=config)
+
+    assert calls == [source.read_bytes(), source.read_bytes()]
+
+
+def test_bulk_uuid4_generates_distinct_version_4_ids() -> None:
+    ids = bulk_uuid4(64)
+
+    assert len(set(ids)) == 64
+    assert all(value.version == 4 and value.variant == RFC_4122 for value in ids)
+
+
+@pytest.mark.parametrize("grouping", ["canonical", "page"])
+def test_long_documents_parse_pages_on_opt_in_pool_with_same_result(
+    monkeypatch: pytest.MonkeyPatch,
+    grouping: str,
+) -> None:
+    pages = [f"# Page {number}\n\nBody text for page {number}.\n" for number in range(1, 10)]
+    content = "\n".join(pages)
+    spans, offset = [], 0
+    for page in pages:
+        spans.append({"spans": [{"offset": offset, "length": len(page)}]})
+        offset += len(page) + 1
+    _patch_cached_result(monkeypatch, {"content": content, "pages": spans})
+
+    def _signature(blocks: list[Block]) -> list[tuple[str, str | None, list[int]]]:
+        page_numbers = {
+            block.id: block.properties.page_number for block in blocks if block.type is BlockType.PAGE_GROUP
+        }
+        return [
+            (
+                block.type.value,
+                block.content.plain_text if block.content else None,
+                [page_numbers[group] for group in getattr(block.properties, "groups", [])],
+            )
+            for block in blocks
+            if block.type not in {BlockType.DOCUMENT, BlockType.GROUP_INDEX, BlockType.PAGE_GROUP}
+        ]
+
+    pools: dict = {}
+    monkeypatch.setattr("block_data_store.parser.azure_di_parser._PAGE_POOLS", pools)
+
+    sequential = azure_di_to_blocks("unused", grouping=grouping)
+    assert not pools  # parsing stays in-process unless workers are requested
+
+    try:
+        parallel = azure_di_to_blocks("unused", grouping=grouping, max_workers=2)
+        pool = pools[2]
+        azure_di_to_blocks("unused", grouping=grouping, max_workers=2)
+        assert pools == {2: pool}
+    finally:
+        azure_di_parser._shutdown_page_pools()
+    assert not pools
+
+    assert _signature(parallel) == _signature(sequential)
+    assert sum(1 for block in parallel if block.type is BlockType.PAGE_GROUP) == 9
+
+
+def test_result_payload_reads_object_and_dict_spans() -> None:
+    result = SimpleNamespace(
+        content="abcdef",
+        model_id="prebuilt-layout",
+        pages=[
+            SimpleNamespace(spans=[SimpleNamespace(offset=0, length=3)]),
+            SimpleNamespace(spans=[{"offset": 3, "length": 3}]),
+            SimpleNamespace(spans=None),
+        ],
+    )
+
+    payload = _result_payload(result)
+
+    assert payload["pages"] == [
+        {"spans": [{"offset": 0, "length": 3}]},
+        {"spans": [{"offset": 3, "length": 3}]},
+        {"spans": []},
+    ]
+
+
+def test_analyze_with_cache_returns_fetched_at_as_text_from_every_source(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    result = SimpleNamespace(content="abc", model_id="prebuilt-layout", pages=[])
+    monkeypatch.setattr(
+        "block_data_store.parser.azure_di_parser._run_analyze_request",
+        lambda data, config, client: _result_payload(result),
+    )
+    config = AzureDiConfig(cache_dir=tmp_path)
+
+    fresh = analyze_with_cache(b"fetched-at sample", config=config)
+    azure_di_parser._MEMORY_CACHE.clear()
+    from_disk = analyze_with_cache(b"fetched-at sample", config=config)
+
+    assert isinstance(fresh["fetched_at"], str)
+    assert from_disk["fetched_at"] == fresh["fetched_at"]
+
+
 @pytest.mark.azure_di
 def test_live_azure_di_smoke() -> None:
     pytest.importorskip("azure.ai.documentintelligence")
@@ -72,6 +72,24 @@ def test_dataset_parser_sheet_name_passthrough(monkeypatch) -> None:
     assert blocks  # ensure parser returned something
     assert captured["reader"] == "excel"
     assert captured["kwargs"]["sheet_name"] == "Sheet 2"
+    assert "engine" not in captured["kwargs"]  # engine choice is left to read_kwargs
+
+
+def test_dataset_parser_gives_each_record_its_own_properties() -> None:
+    blocks = dataset_to_blocks(b"name\nAlice\nBob\n")
+    records = blocks[1:]
+
+    assert records[0].properties is not records[1].properties
+    records[0].properties.groups.append(UUID(int=1))
+    assert records[1].properties.groups == []
+    assert len({record.id for record in records}) == 2
+    assert all(record.id.version == 4 for record in records)
+
+
+def test_dataset_parser_keeps_csv_dates_as_strings() -> None:
+    blocks = dataset_to_blocks(b"name,seen\nAlice,2024-01-05 10:00:00\n")
+
+    assert blocks[1].content.data == {"name": "Alice", "seen": "2024-01-05 10:00:00"}
 
 
 # ---------------------------------------------------------------------------